@@ -9,6 +9,7 @@ from typing import List
 from predictably._config import (
     config_context,
     get_config,
+    get_config_value,
     get_default_config,
     reset_config,
     set_config,
@@ -20,6 +21,7 @@ __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = [
     "get_default_config",
     "get_config",
+    "get_config_value",
     "set_config",
     "reset_config",
     "config_context",
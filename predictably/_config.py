@@ -19,6 +19,7 @@ __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = [
     "get_default_config",
     "get_config",
+    "get_config_value",
     "set_config",
     "reset_config",
     "config_context",
@@ -83,6 +84,23 @@ def _get_threadlocal_config() -> Dict[GlobalConfigParam, Any]:
     return _THREAD_LOCAL_DATA.global_config  # type: ignore
 
 
+def _restore_config(config: Dict[GlobalConfigParam, Any]) -> None:
+    """Restore a previously retrieved configuration.
+
+    The values of `config` were already validated when they were set, so they
+    are restored without validating them again. Like :func:`set_config`, this
+    updates the threadlocal and global configuration.
+
+    Parameters
+    ----------
+    config : dict[GlobalConfigParam, Any]
+        The configuration to restore, as returned by :func:`get_config`.
+    """
+    local_config = _get_threadlocal_config()
+    local_config.update(config)
+    global_config.update(local_config)
+
+
 def get_default_config() -> Dict[GlobalConfigParam, Any]:
     """Retrieve the default global configuration.
 
@@ -144,6 +162,41 @@ def get_config() -> Dict[GlobalConfigParam, Any]:
     return _get_threadlocal_config().copy()
 
 
+def get_config_value(name: GlobalConfigParam) -> Any:
+    """Retrieve the current value of a single configuration setting.
+
+    Unlike :func:`get_config`, this does not copy the configuration, which
+    makes it the cheaper option when only one setting is needed.
+
+    Parameters
+    ----------
+    name : str
+        The name of the configurable setting.
+
+    Returns
+    -------
+    Any
+        The current value of the setting.
+
+    Raises
+    ------
+    KeyError
+        If `name` is not a configurable setting.
+
+    See Also
+    --------
+    get_config :
+        Retrieve current global configuration values.
+
+    Examples
+    --------
+    >>> from predictably import get_config_value
+    >>> get_config_value("display")
+    'text'
+    """
+    return _get_threadlocal_config()[name]
+
+
 def set_config(
     *,
     dataframe_backend: Optional[DATAFRAME_BACKENDS] = None,
@@ -244,8 +297,7 @@ def set_config(
         dict
             The updated local configuration.
         """
-        config_reg = _CONFIG_REGISTRY.copy()
-        value = config_reg[param_name].get_valid_param_or_default(
+        value = _CONFIG_REGISTRY[param_name].get_valid_param_or_default(
             param,
             default_value=local_config[param_name],
             msg=msg,
@@ -391,6 +443,7 @@ def config_context(
     >>> with config_context(display='diagram'):
     ...     pass
     """
+    # Config values are immutable, so a shallow copy is enough to restore them
     old_config = get_config()
     set_config(
         dataframe_backend=dataframe_backend,
@@ -403,4 +456,4 @@ def config_context(
     try:
         yield
     finally:
-        set_config(**old_config)
+        _restore_config(old_config)
@@ -6,8 +6,8 @@ Used to store information about predictably's global configuration.
 """
 import collections
 import warnings
-from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, List, Optional, Tuple, Union
 
 from predictably.utils._iter import _format_seq_to_str
 
@@ -20,13 +20,56 @@ class GlobalConfigParamSetting:
     """Metadata about a given for a given config parameter.
 
     Also provides utility methods to retrieve information about the global
-    parameter.
+    parameter. The tuple versions of `expected_type` and `allowed_values` (and a
+    frozenset of hashable `allowed_values`) are created when those fields are set.
     """
 
     name: str
     expected_type: Union[type, Tuple[type]]
     default_value: Any
     allowed_values: Optional[Union[Tuple[Any, ...], List[Any]]]
+    _expected_type_tuple: Tuple[type, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _allowed_values_tuple: Tuple[Any, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _allowed_values_set: Optional[FrozenSet[Any]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Cache the tuple versions of `expected_type` and `allowed_values`."""
+        self._cache_values()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, updating the cached values if needed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        value : Any
+            The value to set.
+        """
+        super().__setattr__(name, value)
+        # The values are first cached in __post_init__, once all fields are set
+        if name in ("expected_type", "allowed_values") and hasattr(
+            self, "_allowed_values_set"
+        ):
+            self._cache_values()
+
+    def _cache_values(self) -> None:
+        """Cache the tuple versions of `expected_type` and `allowed_values`."""
+        self._expected_type_tuple = self._get_values("expected_type")
+        allowed_values = self._get_values("allowed_values")
+        self._allowed_values_tuple = allowed_values
+        # Allow constant time membership checks when all values are hashable
+        try:
+            allowed_values_set: Optional[FrozenSet[Any]] = frozenset(allowed_values)
+        except TypeError:
+            allowed_values_set = None
+        self._allowed_values_set = allowed_values_set
 
     def _get_values(self, param: str) -> Tuple[Any, ...]:
         """Get values of specified parameter.
@@ -64,7 +107,7 @@ class GlobalConfigParamSetting:
         tuple
             Allowable values if any.
         """
-        return self._get_values("allowed_values")
+        return self._allowed_values_tuple
 
     def get_expected_type(self) -> Tuple[type, ...]:
         """Get global parameter's `expected_type`.
@@ -76,7 +119,7 @@ class GlobalConfigParamSetting:
         tuple
             Allowable values if any.
         """
-        return self._get_values("expected_type")
+        return self._expected_type_tuple
 
     def is_valid_param_value(self, value: Any) -> bool:
         """Validate that a global configuration value is valid.
@@ -97,10 +140,16 @@ class GlobalConfigParamSetting:
         valid_param: bool
         if not isinstance(value, self.expected_type):
             valid_param = False
-        elif self.allowed_values is not None and value not in self.get_allowed_values():
-            valid_param = False
-        else:
+        elif self.allowed_values is None:
             valid_param = True
+        elif self._allowed_values_set is not None:
+            try:
+                valid_param = value in self._allowed_values_set
+            except TypeError:
+                # Unhashable values can still equal an allowed value
+                valid_param = value in self._allowed_values_tuple
+        else:
+            valid_param = value in self._allowed_values_tuple
         return valid_param
 
     def get_valid_param_or_default(
@@ -132,13 +181,13 @@ class GlobalConfigParamSetting:
             return value
         else:
             expected_type_str = _format_seq_to_str(
-                self.get_expected_type(), last_sep="or", remove_type_text=True
+                self._expected_type_tuple, last_sep="or", remove_type_text=True
             )
             msg += f"When setting global config values for `{self.name}`, the values "
             msg += f"should be of type {expected_type_str}.\n"
             if self.allowed_values is not None:
                 values_str = _format_seq_to_str(
-                    self.get_allowed_values(), last_sep="or", remove_type_text=True
+                    self._allowed_values_tuple, last_sep="or", remove_type_text=True
                 )
                 msg += f"Allowed values should be one of {values_str}. "
             msg += f"But found {value}."
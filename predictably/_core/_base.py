@@ -8,6 +8,7 @@
 `predictably` classes typically inherit from ``BaseClass``.
 """
 import collections
+import functools
 import inspect
 import re
 import sys
@@ -17,10 +18,12 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
@@ -40,7 +43,193 @@ from predictably.utils._iter import _format_seq_to_str
 __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = ["BaseEstimator", "BaseObject"]
 
+# Immutable types that copy.deepcopy returns unchanged
+_ATOMIC_TYPES: FrozenSet[type] = frozenset(
+    {int, float, bool, complex, str, bytes, type(None)}
+)
+
+
+def _is_atomic(x: Any) -> bool:
+    """Indicate if an object is immutable.
+
+    Parameters
+    ----------
+    x : Any
+        The object to check.
+
+    Returns
+    -------
+    bool
+        Whether `x` is an atomic value or a tuple that only contains atomic values.
+    """
+    type_ = type(x)
+    if type_ in _ATOMIC_TYPES:
+        return True
+    return type_ is tuple and all(type(e) in _ATOMIC_TYPES for e in x)
+
+
+def _fast_deepcopy(x: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Deepcopy an object with a fast path for atomic types.
+
+    Atomic (immutable) values, and tuples that only contain atomic values, are
+    returned as is. All other values are copied using ``copy.deepcopy``.
+
+    Parameters
+    ----------
+    x : Any
+        The object to copy.
+    memo : dict[int, Any], default=None
+        The memo dictionary passed through to ``copy.deepcopy``.
+
+    Returns
+    -------
+    Any
+        A deep copy of `x` or `x` itself if it is immutable.
+    """
+    if _is_atomic(x):
+        return x
+    return deepcopy(x, memo)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_init_parameters(cls: type) -> Tuple[inspect.Parameter, ...]:
+    """Get the parameters of a class's init signature.
+
+    The result only depends on the class, so it is cached to avoid repeatedly
+    inspecting the signature.
 
+    Parameters
+    ----------
+    cls : type
+        The class whose init signature is inspected.
+
+    Returns
+    -------
+    tuple[inspect.Parameter, ...]
+        The inspected parameter objects (including defaults).
+
+    Raises
+    ------
+    RuntimeError
+        If cls has varargs in __init__.
+    """
+    # fetch the constructor
+    init = cls.__init__  # type: ignore[misc]
+    if init is object.__init__:
+        # No explicit constructor to introspect
+        return ()
+
+    # introspect the constructor arguments to find the model parameters
+    # to represent
+    init_signature = inspect.signature(init)
+
+    # Consider the constructor parameters excluding 'self'
+    parameters = tuple(
+        p
+        for p in init_signature.parameters.values()
+        if p.name != "self" and p.kind != p.VAR_KEYWORD
+    )
+    for p in parameters:
+        if p.kind == p.VAR_POSITIONAL:
+            raise RuntimeError(
+                "scikit-learn compatible estimators should always "
+                "specify their parameters in the signature"
+                " of their __init__ (no varargs)."
+                " %s with constructor %s doesn't "
+                " follow this convention." % (cls, init_signature)
+            )
+
+    return parameters
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sorted_param_names(cls: type, init_only: bool = True) -> Tuple[str, ...]:
+    """Get a class's alphabetically sorted parameter names.
+
+    Parameters
+    ----------
+    cls : type
+        The class whose parameter names are returned.
+    init_only : bool, default=True
+        Whether to only return ``attrs.field`` that are set to be part of the
+        object's initialization.
+
+    Returns
+    -------
+    tuple[str, ...]
+        Alphabetically sorted parameter names of cls.
+    """
+    # Interned names make lookups of the param dicts keyed by them cheaper
+    if init_only:
+        names = (p.name for p in _get_init_parameters(cls))
+    else:
+        names = attrs.fields_dict(cls).keys()
+    return tuple(sorted(sys.intern(name) for name in names))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_slot_names(cls: type) -> Tuple[str, ...]:
+    """Get the names of the instance attributes a class stores in slots.
+
+    Parameters
+    ----------
+    cls : type
+        The class whose slots are returned, including slots of its parents.
+
+    Returns
+    -------
+    tuple[str, ...]
+        The names of the class's slots, excluding "__dict__" and "__weakref__".
+    """
+    slot_names: Dict[str, None] = {}
+    for class_ in cls.__mro__:
+        slots = class_.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__"):
+                slot_names[name] = None
+    return tuple(slot_names)
+
+
+def _clone_like(x: Any) -> Any:
+    """Copy an object using a copy strategy based on its type.
+
+    Atomic values are returned as is, BaseObjects are deep copied and lists,
+    tuples and dicts are rebuilt with their elements copied the same way. Any
+    other object is copied using ``copy.deepcopy``.
+
+    Parameters
+    ----------
+    x : Any
+        The object to copy.
+
+    Returns
+    -------
+    Any
+        A copy of `x` or `x` itself if it is immutable.
+
+    Notes
+    -----
+    Unlike ``copy.deepcopy``, shared references within lists, tuples and dicts
+    are not preserved, so it should not be used for self-referencing containers.
+    """
+    type_ = type(x)
+    if type_ in _ATOMIC_TYPES:
+        return x
+    elif isinstance(x, BaseObject):
+        return deepcopy(x)
+    elif type_ is list:
+        return [_clone_like(e) for e in x]
+    elif type_ is tuple:
+        return tuple(_clone_like(e) for e in x)
+    elif type_ is dict:
+        return {k: _clone_like(v) for k, v in x.items()}
+    return deepcopy(x)
+
+
+# BaseObject is not slotted so that subclasses, including attrs classes that
+# default to slots=True, can set fitted attributes that aren't declared fields
 @attrs.define(kw_only=True, slots=False, repr=False)
 class BaseObject:
     """Base class for `predictably` classes with tag and config management.
@@ -51,6 +240,10 @@ class BaseObject:
 
     _tags: ClassVar[Dict[str, Any]] = {}
     _config: ClassVar[Dict[str, Any]] = {}
+    # Class level defaults for instance caches avoid failed instance lookups
+    _repr_cache: ClassVar[Optional[Tuple[Any, ...]]] = None
+    # Start of the class's repr, set per subclass in __init_subclass__
+    _repr_prefix: ClassVar[str] = "BaseObject("
     _tags_dynamic: Dict[str, Any] = attrs.field(
         init=False, repr=False, alias="_tags_dynamic", factory=dict
     )
@@ -58,11 +251,16 @@ class BaseObject:
         init=False, repr=False, alias="_config_dynamic", factory=dict
     )
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute class level values used when representing instances."""
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = cls.__name__ + "("
+
     @classmethod
     def _get_init_signature(cls) -> List[inspect.Parameter]:
         """Get class init signature.
 
-        Useful in parameter inspection.
+        Useful in parameter inspection. The inspected signature is cached per class.
 
         Returns
         -------
@@ -73,33 +271,7 @@ class BaseObject:
         ------
         RuntimeError if cls has varargs in __init__.
         """
-        # fetch the constructor
-        init = cls.__init__
-        if init is object.__init__:
-            # No explicit constructor to introspect
-            return []
-
-        # introspect the constructor arguments to find the model parameters
-        # to represent
-        init_signature = inspect.signature(init)
-
-        # Consider the constructor parameters excluding 'self'
-        parameters = [
-            p
-            for p in init_signature.parameters.values()
-            if p.name != "self" and p.kind != p.VAR_KEYWORD
-        ]
-        for p in parameters:
-            if p.kind == p.VAR_POSITIONAL:
-                raise RuntimeError(
-                    "scikit-learn compatible estimators should always "
-                    "specify their parameters in the signature"
-                    " of their __init__ (no varargs)."
-                    " %s with constructor %s doesn't "
-                    " follow this convention." % (cls, init_signature)
-                )
-
-        return parameters
+        return list(_get_init_parameters(cls))
 
     @classmethod
     def _get_param_names(cls, init_only: bool = True) -> List[str]:
@@ -124,12 +296,7 @@ class BaseObject:
         list[str]
             Alphabetically sorted list of parameter names of cls.
         """
-        if init_only:
-            parameters = sorted([p.name for p in cls._get_init_signature()])
-        else:
-            parameters = sorted(attrs.fields_dict(cls).keys())
-
-        return parameters
+        return list(_get_sorted_param_names(cls, init_only=init_only))
 
     @classmethod
     def _get_param_defaults(cls, init_only: bool = True) -> Dict[str, Any]:
@@ -294,7 +461,7 @@ class BaseObject:
                 more_flags = getattr(parent_class, flag_attr_name)
                 collected_flags.update(more_flags)
 
-        return deepcopy(collected_flags)
+        return _clone_like(collected_flags)
 
     @classmethod
     def _get_class_flag(
@@ -364,7 +531,7 @@ class BaseObject:
         if hasattr(self, f"{flag_attr_name}_dynamic"):
             collected_flags.update(getattr(self, f"{flag_attr_name}_dynamic"))
 
-        return deepcopy(collected_flags)
+        return _clone_like(collected_flags)
 
     def _get_flag(
         self,
@@ -433,7 +600,7 @@ class BaseObject:
         Changes object state by setting flag values in flag_dict as dynamic flags
         in self.
         """
-        flag_update = deepcopy(flag_dict)
+        flag_update = _clone_like(flag_dict)
         dynamic_flags = f"{flag_attr_name}_dynamic"
         if hasattr(self, dynamic_flags):
             getattr(self, dynamic_flags).update(flag_update)
@@ -474,7 +641,8 @@ class BaseObject:
         Changes object state by setting flag values in flag_set from object as
         dynamic flags in self.
         """
-        flags_est = deepcopy(obj._get_flags(flag_attr_name=flag_attr_name))
+        # _get_flags already returns a copy of the flags
+        flags_est = obj._get_flags(flag_attr_name=flag_attr_name)
 
         # if flag_set is not passed, default is all flags in object
         flag_names_: Iterable[str]
@@ -759,6 +927,29 @@ class BaseObject:
 
         return self
 
+    def clone(self) -> Self:
+        """Get a clone of the object with the same hyper-parameters.
+
+        A clone is a different object without shared references, in post-init
+        state. Parameters that are themselves ``BaseObject`` instances are cloned
+        recursively, while other parameter values are copied.
+
+        Returns
+        -------
+        Self
+            Instance of ``type(self)``, clone of self (see above).
+
+        Notes
+        -----
+        Equivalent to sklearn.clone. After ``clone = self.clone()``, clone is
+        equal in value to ``type(self)(**self.get_params(deep=False))``.
+        """
+        params = {
+            name: value.clone() if isinstance(value, BaseObject) else _clone_like(value)
+            for name, value in self.get_params(deep=False).items()
+        }
+        return type(self)(**params)
+
     def is_composite(self) -> bool:
         """Check if the object is composed of other BaseObjects.
 
@@ -840,6 +1031,19 @@ class BaseObject:
         """
         from predictably._core._pprint._pprint import _BaseObjectPrettyPrinter
 
+        changed_only = self._get_config()["print_changed_only"]
+        # The cached repr is reused while the parameters are the same objects
+        deep_params = self.get_params(deep=True)
+        repr_key = (n_char_max, changed_only)
+        repr_cache = self._repr_cache
+        if (
+            repr_cache is not None
+            and repr_cache[0] == repr_key
+            and repr_cache[1].keys() == deep_params.keys()
+            and all(v is repr_cache[1][k] for k, v in deep_params.items())
+        ):
+            return repr_cache[2]
+
         n_max_elements_to_show = 30  # number of elements to show in sequences
         # use ellipsis for sequences with a lot of elements
         pp = _BaseObjectPrettyPrinter(
@@ -847,7 +1051,7 @@ class BaseObject:
             indent=1,
             indent_at_name=True,
             n_max_elements_to_show=n_max_elements_to_show,
-            changed_only=self._get_config()["print_changed_only"],
+            changed_only=changed_only,
         )  # type: ignore
 
         repr_ = pp.pformat(self)
@@ -885,6 +1089,12 @@ class BaseObject:
                 # Only add ellipsis if it results in a shorter repr
                 repr_ = repr_[:left_lim] + "..." + repr_[-right_lim:]
 
+        # Mutable parameter values can change without changing the parameter
+        # mapping, so only cache the repr when all values are immutable
+        if all(
+            _is_atomic(v) or isinstance(v, BaseObject) for v in deep_params.values()
+        ):
+            object.__setattr__(self, "_repr_cache", (repr_key, deep_params, repr_))
         return repr_
 
     @property
@@ -943,6 +1153,41 @@ class BaseObject:
             output["text/html"] = _object_html_repr(self)
         return output
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
+        """Return a deep copy of the object.
+
+        Skips ``copy.deepcopy``'s reduce protocol by creating a new instance and
+        copying the instance attributes (including attributes stored in slots by
+        slotted subclasses), using a fast path for atomic values.
+
+        Parameters
+        ----------
+        memo : dict[int, Any]
+            Mapping of ids of objects already copied to their copies.
+
+        Returns
+        -------
+        Self
+            A deep copy of the object.
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        # Register the copy up front so reference cycles resolve to it
+        memo[id(self)] = new
+        # The copy rebuilds its own caches when needed
+        new_dict = new.__dict__
+        for name, value in self.__dict__.items():
+            if name != "_repr_cache":
+                new_dict[name] = _fast_deepcopy(value, memo)
+        for name in _get_slot_names(cls):
+            try:
+                value = object.__getattribute__(self, name)
+            except AttributeError:
+                # Unset slot
+                continue
+            object.__setattr__(new, name, _fast_deepcopy(value, memo))
+        return new
+
 
 @attrs.define(kw_only=False, slots=False, repr=False)
 class BaseEstimator(BaseObject):
@@ -996,10 +1241,7 @@ class BaseEstimator(BaseObject):
         NotFittedError
             If the estimator has not been fitted yet.
         """
-        if not self.is_fitted and raise_error:
-            raise NotFittedError(
-                f"This instance of {self.__class__.__name__} has not been fitted yet. "
-                f"Please call `fit` first."
-            )
-        else:
-            return self.is_fitted
+        is_fitted = self._is_fitted
+        if not is_fitted and raise_error:
+            raise NotFittedError(estimator_name=type(self).__name__)
+        return is_fitted
@@ -7,6 +7,7 @@
 
 Custom exceptions used to raise useful error messages in `predictably`.
 """
+from typing import Any, Optional
 
 
 class ForwardRefError(TypeError):
@@ -14,9 +15,23 @@ class ForwardRefError(TypeError):
 
     Should be used when raising an error when trying to evaluate arguments of forward
     reference annotations within a function and it is not possible to do so.
+
+    Parameters
+    ----------
+    *args : Any
+        Arguments passed to the exception, typically the error message.
+    forward_ref : str, default=None
+        Name of the forward reference that could not be evaluated. If no message
+        is passed, it is used to format the standard message.
     """
 
-    pass
+    def __init__(self, *args: Any, forward_ref: Optional[str] = None) -> None:
+        if not args and forward_ref is not None:
+            msg = "Error deriving name of forward ref for unsupported dependency "
+            msg += f"{forward_ref}."
+            args = (msg,)
+        super().__init__(*args)
+        self.forward_ref = forward_ref
 
 
 class NotFittedError(ValueError, AttributeError):
@@ -25,9 +40,25 @@ class NotFittedError(ValueError, AttributeError):
     This class inherits from both ValueError and AttributeError to help with
     exception handling.
 
+    Parameters
+    ----------
+    *args : Any
+        Arguments passed to the exception, typically the error message.
+    estimator_name : str, default=None
+        Name of the unfitted estimator's class. If no message is passed, it is
+        used to format the standard message.
+
     References
     ----------
     [1] scikit-learn's NotFittedError
     [2] sktime's NotFittedError
     [3] skbase's NotFittedError
     """
+
+    def __init__(self, *args: Any, estimator_name: Optional[str] = None) -> None:
+        if not args and estimator_name is not None:
+            msg = f"This instance of {estimator_name} has not been fitted yet. "
+            msg += "Please call `fit` first."
+            args = (msg,)
+        super().__init__(*args)
+        self.estimator_name = estimator_name
@@ -133,13 +133,19 @@ class _BaseObjectPrettyPrinter(pprint.PrettyPrinter):
 
     def format(self, obj, context, maxlevels, level):  # noqa: A003
         return _safe_repr(
-            obj, context, maxlevels, level, changed_only=self.changed_only
+            obj,
+            context,
+            maxlevels,
+            level,
+            changed_only=self.changed_only,
+            n_max_elements_to_show=self.n_max_elements_to_show,
         )
 
     def _pprint_object(self, obj, stream, indent, allowance, context, level):
-        stream.write(obj.__class__.__name__ + "(")
+        repr_prefix = obj._repr_prefix
+        stream.write(repr_prefix)
         if self._indent_at_name:
-            indent += len(obj.__class__.__name__)
+            indent += len(repr_prefix) - 1
 
         if self.changed_only:
             params = _changed_params(obj)
@@ -300,10 +306,17 @@ class _BaseObjectPrettyPrinter(pprint.PrettyPrinter):
     _dispatch[KeyValTuple.__repr__] = _pprint_key_val_tuple
 
 
-def _safe_repr(obj, context, maxlevels, level, changed_only=False):
+def _safe_repr(
+    obj, context, maxlevels, level, changed_only=False, n_max_elements_to_show=None
+):
     """Safe string representation logic.
 
     Same as the builtin _safe_repr, with added support for BaseObjects.
+
+    Lists and tuples with more than `n_max_elements_to_show` elements are
+    rendered with an ellipsis after that many elements. Their full single line
+    representation never fits on a line, so the pretty printer formats them with
+    an ellipsis anyway and rendering the remaining elements is wasted work.
     """
     typ = type(obj)
 
@@ -329,10 +342,20 @@ def _safe_repr(obj, context, maxlevels, level, changed_only=False):
         items = sorted(obj.items(), key=pprint._safe_tuple)
         for k, v in items:
             krepr, kreadable, krecur = saferepr(
-                k, context, maxlevels, level, changed_only=changed_only
+                k,
+                context,
+                maxlevels,
+                level,
+                changed_only=changed_only,
+                n_max_elements_to_show=n_max_elements_to_show,
             )
             vrepr, vreadable, vrecur = saferepr(
-                v, context, maxlevels, level, changed_only=changed_only
+                v,
+                context,
+                maxlevels,
+                level,
+                changed_only=changed_only,
+                n_max_elements_to_show=n_max_elements_to_show,
             )
             append(f"{krepr}: {vrepr}")
             readable = readable and kreadable and vreadable
@@ -365,9 +388,19 @@ def _safe_repr(obj, context, maxlevels, level, changed_only=False):
         components = []
         append = components.append
         level += 1
-        for o in obj:
+        for n_items, o in enumerate(obj):
+            if n_items == n_max_elements_to_show:
+                # The elided elements can't be evaluated back to the object
+                append("...")
+                readable = False
+                break
             orepr, oreadable, orecur = _safe_repr(
-                o, context, maxlevels, level, changed_only=changed_only
+                o,
+                context,
+                maxlevels,
+                level,
+                changed_only=changed_only,
+                n_max_elements_to_show=n_max_elements_to_show,
             )
             append(orepr)
             if not oreadable:
@@ -397,10 +430,20 @@ def _safe_repr(obj, context, maxlevels, level, changed_only=False):
         items = sorted(params.items(), key=pprint._safe_tuple)
         for k, v in items:
             krepr, kreadable, krecur = saferepr(
-                k, context, maxlevels, level, changed_only=changed_only
+                k,
+                context,
+                maxlevels,
+                level,
+                changed_only=changed_only,
+                n_max_elements_to_show=n_max_elements_to_show,
             )
             vrepr, vreadable, vrecur = saferepr(
-                v, context, maxlevels, level, changed_only=changed_only
+                v,
+                context,
+                maxlevels,
+                level,
+                changed_only=changed_only,
+                n_max_elements_to_show=n_max_elements_to_show,
             )
             append("{}={}".format(krepr.strip("'"), vrepr))
             readable = readable and kreadable and vreadable
@@ -408,7 +451,7 @@ def _safe_repr(obj, context, maxlevels, level, changed_only=False):
                 recursive = True
         del context[objid]
         return (
-            "{}({})".format(typ.__name__, ", ".join(components)),
+            "{}{})".format(typ._repr_prefix, ", ".join(components)),
             readable,
             recursive,
         )
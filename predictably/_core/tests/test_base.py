@@ -43,22 +43,27 @@ __all__ = [
     "test_get_params",
     "test_get_params_invariance",
     "test_get_params_after_set_params",
+    "test_get_params_reflects_updates",
     "test_set_params",
     "test_set_params_raises_error_non_existent_param",
     "test_set_params_raises_error_non_interface_composite",
     "test_raises_on_get_params_for_param_arg_not_assigned_to_attribute",
     "test_set_params_with_no_param_to_set_returns_object",
-    # "test_clone",
-    # "test_clone_2",
+    "test_clone",
+    "test_clone_2",
+    "test_clone_composite",
     # "test_clone_raises_error_for_nonconforming_objects",
     # "test_clone_param_is_none",
     # "test_clone_empty_array",
     # "test_clone_sparse_matrix",
     # "test_clone_nan",
-    # "test_clone_estimator_types",
+    "test_clone_estimator_types",
     # "test_clone_class_rather_than_instance_raises_error",
     # "test_clone_sklearn_composite",
     "test_baseobject_repr",
+    "test_baseobject_repr_cache",
+    "test_baseobject_repr_prefix",
+    "test_safe_repr_elided_elements_not_readable",
     "test_baseobject_str",
     "test_baseobject_repr_mimebundle_",
     "test_repr_html_wraps",
@@ -68,8 +73,12 @@ __all__ = [
     # "test_create_test_instances_and_names",
     # "test_has_implementation_of",
     "test_eq_dunder",
+    "test_deepcopy_dunder",
+    "test_clone_like",
+    "test_clone_like_other_objects",
 ]
 
+import collections
 import inspect
 from copy import deepcopy
 from typing import Any, ClassVar, Dict, Optional, Type
@@ -78,7 +87,13 @@ import attrs
 import numpy as np
 import pytest
 
-from predictably._core._base import BaseEstimator, BaseObject
+from predictably._core._base import (
+    BaseEstimator,
+    BaseObject,
+    _clone_like,
+    _fast_deepcopy,
+)
+from predictably._core._pprint._pprint import _safe_repr
 from predictably.tests.conftest import Child, CompositionDummy, Parent
 
 
@@ -705,6 +720,26 @@ def test_get_params_after_set_params(fixture_class_parent: Type[Parent]):
         test_params[param_name] = default_value
 
 
+def test_get_params_reflects_updates(
+    fixture_class_parent: Type[Parent],
+    fixture_composition_dummy: Type[CompositionDummy],
+):
+    """Test get_params results reflect parameter updates."""
+    composite = fixture_composition_dummy(foo=fixture_class_parent(), bar=84)
+    params = composite.get_params()
+    # Modifying returned parameters should not impact later calls
+    params["bar"] = 95
+    assert composite.get_params()["bar"] == 84
+
+    # Updating the object's parameters directly or via a component is reflected
+    composite.bar = 95
+    assert composite.get_params()["bar"] == 95
+    composite.foo.b = 42
+    assert composite.get_params()["foo__b"] == 42
+    composite.foo.set_params(c="updated param value")
+    assert composite.get_params()["foo__c"] == "updated param value"
+
+
 def test_set_params(
     fixture_class_parent: Type[Parent],
     fixture_class_parent_expected_params: Dict[str, Any],
@@ -791,26 +826,39 @@ def test_set_params_with_no_param_to_set_returns_object(
 # This section tests the clone functionality
 # These have been adapted from sklearn's tests of clone to use the clone
 # method that is included as part of the BaseObject interface
-# def test_clone(fixture_class_parent_instance: Parent):
-#     """Test that clone is making a deep copy as expected."""
-#     # Creates a BaseObject and makes a copy of its original state
-#     # (which, in this case, is the current state of the BaseObject),
-#     # and check that the obtained copy is a correct deep copy.
-#     new_base_obj = fixture_class_parent_instance.clone()
-#     assert fixture_class_parent_instance is not new_base_obj
-#     assert fixture_class_parent_instance.get_params() == new_base_obj.get_params()
-
-
-# def test_clone_2(fixture_class_parent_instance: Parent):
-#     """Test that clone does not copy attributes not set in constructor."""
-#     # We first create an estimator, give it an own attribute, and
-#     # make a copy of its original state. Then we check that the copy doesn't
-#     # have the specific attribute we manually added to the initial estimator.
+def test_clone(fixture_class_parent_instance: Parent):
+    """Test that clone is making a deep copy as expected."""
+    # Creates a BaseObject and makes a copy of its original state
+    # (which, in this case, is the current state of the BaseObject),
+    # and check that the obtained copy is a correct deep copy.
+    new_base_obj = fixture_class_parent_instance.clone()
+    assert fixture_class_parent_instance is not new_base_obj
+    assert fixture_class_parent_instance.get_params() == new_base_obj.get_params()
+
+
+def test_clone_2(fixture_class_parent_instance: Parent):
+    """Test that clone does not copy attributes not set in constructor."""
+    # We first create an estimator, give it an own attribute, and
+    # make a copy of its original state. Then we check that the copy doesn't
+    # have the specific attribute we manually added to the initial estimator.
+
+    # base_obj = fixture_class_parent(a=7.0, b="some_str")
+    fixture_class_parent_instance.own_attribute = "test"
+    new_base_obj = fixture_class_parent_instance.clone()
+    assert not hasattr(new_base_obj, "own_attribute")
+
+
+def test_clone_composite(fixture_class_parent_instance: Parent):
+    """Test that clone recursively clones components and resets fitted state."""
+    composite = FittableCompositionDummy(foo=fixture_class_parent_instance, bar=84)
+    composite.fit()
+    new_composite = composite.clone()
 
-#     # base_obj = fixture_class_parent(a=7.0, b="some_str")
-#     fixture_class_parent_instance.own_attribute = "test"
-#     new_base_obj = fixture_class_parent_instance.clone()
-#     assert not hasattr(new_base_obj, "own_attribute")
+    assert new_composite.get_params() == composite.get_params()
+    assert new_composite.foo is not composite.foo
+    assert new_composite.foo_ is not composite.foo_
+    assert new_composite.foo_ == new_composite.foo
+    assert composite.is_fitted and not new_composite.is_fitted
 
 
 # def test_clone_raises_error_for_nonconforming_objects(
@@ -905,12 +953,12 @@ def test_set_params_with_no_param_to_set_returns_object(
 #     assert base_obj.c is new_base_obj2.c
 
 
-# def test_clone_estimator_types(fixture_class_parent: Type[Parent]):
-#     """Test clone works for parameters that are types rather than instances."""
-#     base_obj = fixture_class_parent(c=fixture_class_parent)
-#     new_base_obj = base_obj.clone()
+def test_clone_estimator_types(fixture_class_parent: Type[Parent]):
+    """Test clone works for parameters that are types rather than instances."""
+    base_obj = fixture_class_parent(c=fixture_class_parent)
+    new_base_obj = base_obj.clone()
 
-#     assert base_obj.c == new_base_obj.c
+    assert base_obj.c == new_base_obj.c
 
 
 # @pytest.mark.skipif(
@@ -989,6 +1037,46 @@ def test_baseobject_repr(
     assert len(repr(base_comp)) == 1362
 
 
+def test_baseobject_repr_cache(
+    fixture_class_parent: Type[Parent],
+    fixture_composition_dummy: Type[CompositionDummy],
+):
+    """Test cached BaseObject repr reflects updates to the object."""
+    composite = fixture_composition_dummy(foo=fixture_class_parent())
+    assert repr(composite) == "CompositionDummy(foo=Parent())"
+    composite.foo.set_params(b=42)
+    assert repr(composite) == "CompositionDummy(foo=Parent(b=42))"
+    composite._set_config(print_changed_only=False)
+    assert repr(composite) == (
+        "CompositionDummy(bar=84, foo=Parent(a='something', b=42, c=None))"
+    )
+
+    # Mutable parameter values can be updated in place
+    base_obj = fixture_class_parent(c=[1, 2])
+    assert repr(base_obj) == "Parent(c=[1, 2])"
+    base_obj.c.append(3)
+    assert repr(base_obj) == "Parent(c=[1, 2, 3])"
+
+
+def test_baseobject_repr_prefix():
+    """Test that the repr prefix is set for each subclass, including slotted ones."""
+    assert BaseObject._repr_prefix == "BaseObject("
+    assert Parent._repr_prefix == "Parent("
+    assert ResetTester._repr_prefix == "ResetTester("
+    assert repr(ResetTester(a=42)).startswith("ResetTester(")
+
+
+def test_safe_repr_elided_elements_not_readable():
+    """Test that sequences rendered with elided elements aren't readable."""
+    repr_, readable, _ = _safe_repr([1, 2], {}, None, 0, n_max_elements_to_show=2)
+    assert repr_ == "[1, 2]"
+    assert readable
+
+    repr_, readable, _ = _safe_repr([1, 2, 3], {}, None, 0, n_max_elements_to_show=2)
+    assert repr_ == "[1, 2, ...]"
+    assert not readable
+
+
 def test_baseobject_str(fixture_class_parent_instance: Parent):
     """Test BaseObject string representation works."""
     assert (
@@ -1026,7 +1114,7 @@ def test_repr_html_wraps(fixture_class_parent_instance: Parent):
         fixture_class_parent_instance._repr_html_()
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.define(kw_only=True, slots=True)
 class FittableCompositionDummy(BaseEstimator):
     """Potentially composite object, for testing."""
 
@@ -1035,7 +1123,7 @@ class FittableCompositionDummy(BaseEstimator):
     foo_: Optional[int] = attrs.field(alias="foo_", init=False, default=None)
 
     def __attrs_post_init__(self):
-        self.foo_ = deepcopy(self.foo)
+        self.foo_ = _clone_like(self.foo)
 
     def fit(self):
         if hasattr(self.foo_, "fit"):
@@ -1074,8 +1162,8 @@ def test_eq_dunder():
     assert composite_2 != composite_3
 
     # test interaction with clone and copy
-    # assert non_composite.clone() == non_composite
-    # assert composite.clone() == composite
+    assert non_composite.clone() == non_composite
+    assert composite.clone() == composite
     assert deepcopy(non_composite) == non_composite
     assert deepcopy(composite) == composite
 
@@ -1093,3 +1181,74 @@ def test_eq_dunder():
     assert composite == composite_2
     assert composite != composite_3
     assert composite_2 != composite_3
+
+    # test that equality follows parameter updates and is unaffected by reset
+    updated = FittableCompositionDummy(foo=42)
+    updated.set_params(foo=84)
+    assert updated == non_composite_3
+    composite.reset()
+    assert composite == composite_2
+
+
+def test_deepcopy_dunder():
+    """Test deepcopy of BaseObject descendants.
+
+    Raises
+    ------
+    AssertionError if logic behind __deepcopy__ is incorrect, logic tested:
+        copies are equal, but not identical to the original object
+        mutable attributes are copied, while atomic attributes are reused
+        reference cycles resolve to the copied object
+    """
+    assert _fast_deepcopy(42) == 42
+    atomic_tuple = ("a", 1, None)
+    assert _fast_deepcopy(atomic_tuple) is atomic_tuple
+    mutable_list = [1, [2, 3]]
+    copied_list = _fast_deepcopy(mutable_list)
+    assert copied_list == mutable_list and copied_list is not mutable_list
+
+    composite = FittableCompositionDummy(foo=FittableCompositionDummy(foo=[1, 2]))
+    composite_copy = deepcopy(composite)
+    assert composite_copy == composite
+    assert composite_copy is not composite
+    assert composite_copy.foo is not composite.foo
+    assert composite_copy.foo.foo is not composite.foo.foo
+
+    composite.bar = composite
+    composite_copy = deepcopy(composite)
+    assert composite_copy.bar is composite_copy
+
+    # Attributes of attrs classes that store fields in slots are also copied
+    reset_tester = ResetTester(a=[1, 2])
+    reset_tester.foo()
+    reset_tester_copy = deepcopy(reset_tester)
+    assert reset_tester_copy == reset_tester
+    assert reset_tester_copy.a is not reset_tester.a
+    assert reset_tester_copy.d == reset_tester.d
+
+
+def test_clone_like(fixture_class_parent: Type[Parent]):
+    """Test _clone_like copies objects based on their type."""
+    assert _clone_like("some str") == "some str"
+    base_obj = fixture_class_parent(c=[1, 2])
+    nested = {"a": [base_obj, (1, {"b": 2})], "c": None}
+    cloned = _clone_like(nested)
+    assert cloned == nested and cloned is not nested
+    assert cloned["a"] is not nested["a"]
+    assert cloned["a"][0] == base_obj and cloned["a"][0] is not base_obj
+    assert cloned["a"][0].c is not base_obj.c
+    assert cloned["a"][1][1] is not nested["a"][1][1]
+
+
+def test_clone_like_other_objects():
+    """Test _clone_like copies objects without a dedicated copy strategy."""
+    ordered = collections.OrderedDict(a=[1, 2], b={"c": 3})
+    cloned = _clone_like(ordered)
+    assert cloned == ordered and cloned is not ordered
+    assert cloned["a"] is not ordered["a"]
+
+    # Objects are copied using deepcopy, so unpicklable values are supported
+    unpicklable = collections.OrderedDict(a=[1, 2], f=lambda x: x)
+    cloned = _clone_like(unpicklable)
+    assert cloned["a"] == [1, 2] and cloned["a"] is not unpicklable["a"]
+    assert cloned["f"] is unpicklable["f"]
@@ -4,8 +4,10 @@
 
 tests in this module:
 
-    test_exceptions_raise_error - Test that skbase exceptions raise expected error.
+    test_exceptions_raise_error - Test that exceptions raise expected error.
+    test_exceptions_render_standard_message - Test exceptions' standard message.
 """
+import pickle
 from typing import List
 
 import pytest
@@ -17,16 +19,46 @@ __author__: List[str] = ["RNKuhns"]
 ALL_EXCEPTIONS = (ForwardRefError, NotFittedError)
 
 
-@pytest.mark.parametrize("predictably_exception", ALL_EXCEPTIONS)
+@pytest.mark.parametrize(
+    "predictably_exception", ALL_EXCEPTIONS, ids=lambda e: e.__name__
+)
 def test_exceptions_raise_error(predictably_exception):
-    """Test that predictably exceptions raise an error as expected."""
+    """Test that predictably exceptions raise an error as expected.
+
+    Checks raising the exception without a message and with a message.
+    """
     with pytest.raises(predictably_exception):
         raise predictably_exception()
 
-
-@pytest.mark.parametrize("predictably_exception", ALL_EXCEPTIONS)
-def test_exceptions_raise_error_with_message(predictably_exception):
-    """Test that predictably exceptions raise an error with msg as expected."""
     msg = "Some message."
     with pytest.raises(predictably_exception, match=msg):
         raise predictably_exception(msg)
+
+
+def test_exceptions_render_standard_message():
+    """Test that predictably exceptions render their standard message.
+
+    The message is stored in the exception's arguments, so it is kept in the
+    repr and when the exception is pickled.
+    """
+    fref_error = ForwardRefError(forward_ref="zz")
+    assert str(fref_error) == (
+        "Error deriving name of forward ref for unsupported dependency zz."
+    )
+    not_fitted_error = NotFittedError(estimator_name="SomeEstimator")
+    assert str(not_fitted_error) == (
+        "This instance of SomeEstimator has not been fitted yet. "
+        "Please call `fit` first."
+    )
+    assert not_fitted_error.args == (str(not_fitted_error),)
+    assert str(not_fitted_error) in repr(not_fitted_error)
+    unpickled_error = pickle.loads(pickle.dumps(not_fitted_error))
+    assert str(unpickled_error) == str(not_fitted_error)
+    assert unpickled_error.estimator_name == "SomeEstimator"
+    unpickled_error = pickle.loads(pickle.dumps(fref_error))
+    assert str(unpickled_error) == str(fref_error)
+    assert unpickled_error.forward_ref == "zz"
+    # An explicit message takes precedence over the standard message
+    assert str(NotFittedError("Some message.", estimator_name="Other")) == (
+        "Some message."
+    )
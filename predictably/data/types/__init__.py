@@ -6,13 +6,10 @@ Users can declare their data type through the ``from_external_data`` functional
 interface or the `from_array` and `from_dataframe` interface on a particular
 data type class.
 """
-from typing import List
+import importlib
+from typing import Any, Dict, List
 
 from predictably.data.types._base import Metadata
-from predictably.data.types._cross_section import CrossSection
-from predictably.data.types._from_external import from_external_data
-from predictably.data.types._panel import Panel
-from predictably.data.types._timeseries import Timeseries
 
 __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = [
@@ -22,3 +19,44 @@ __all__: List[str] = [
     "Timeseries",
     "from_external_data",
 ]
+
+# The data types are imported on first access (PEP 562), so importing this
+# module doesn't create the data type classes until they are used
+_LAZY_IMPORTS: Dict[str, str] = {
+    "CrossSection": "predictably.data.types._cross_section",
+    "Panel": "predictably.data.types._panel",
+    "Timeseries": "predictably.data.types._timeseries",
+    "from_external_data": "predictably.data.types._from_external",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily loaded public objects of the module on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the attribute.
+
+    Returns
+    -------
+    Any
+        The requested data type or function.
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a public object of the module.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later access doesn't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the module's attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,22 +6,33 @@ All `predictably` data types should inherit from ``BasePredictablyDataType``.
 """
 from __future__ import annotations
 
-import collections
+import functools
 import sys
-from typing import TYPE_CHECKING, Any, Literal, Sequence, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Literal,
+    Mapping,
+    Sequence,
+    overload,
+)
 
 if sys.version_info < (3, 11):
     from typing_extensions import Self
 else:
     from typing import Self
 
-import attr
 import attrs
 import polars as pl
 
+# polars' lazily loaded modules only import pandas and pyarrow when first used
+from polars.dependencies import pandas as pd
+from polars.dependencies import pyarrow as pa
+
 if TYPE_CHECKING:  # pragma: no cover
     import numpy as np  # pragma: no cover
-    import pandas as pd  # pragma: no cover
     import xarray as xa  # pragma: no cover
 
 from predictably._core._base import BaseObject
@@ -32,7 +43,7 @@ from predictably.data.types._types import (
     check_supported_external_type,
     raise_not_supported_external_type,
 )
-from predictably.validate import is_sequence
+from predictably.utils._iter import _format_seq_to_str
 
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = [
@@ -41,7 +52,137 @@ __all__: list[str] = [
 ]
 
 
-@attrs.define(kw_only=True, slots=False, repr=True)
+def _pandas_to_lazyframe(df: pd.DataFrame) -> pl.LazyFrame:
+    """Convert a ``pandas.DataFrame`` (including its index) to a ``pl.LazyFrame``."""
+    return pl.from_pandas(df, include_index=True).lazy()
+
+
+def _arrow_to_lazyframe(df: pa.Table) -> pl.LazyFrame:
+    """Convert a ``pyarrow.Table`` to a ``polars.LazyFrame``."""
+    return pl.from_arrow(df).lazy()
+
+
+def _interchange_to_lazyframe(df: Any) -> pl.LazyFrame:
+    """Convert an object supporting the dataframe interchange protocol."""
+    return pl.from_dataframe(df, allow_copy=True).lazy()
+
+
+def _find_lazyframe_converter(df: Any) -> Callable[[Any], pl.LazyFrame]:
+    """Find the function that converts a dataframe to a ``polars.LazyFrame``.
+
+    Parameters
+    ----------
+    df : pl.LazyFrame | pl.DataFrame | pd.DataFrame | pa.Table
+        The input dataframe.
+
+    Returns
+    -------
+    Callable[[Any], pl.LazyFrame]
+        Function converting dataframes of the same type as `df`.
+
+    Raises
+    ------
+    TypeError
+        If `df` is not a supported dataframe type.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return pl.LazyFrame.lazy
+    elif isinstance(df, pl.DataFrame):
+        return pl.DataFrame.lazy
+    elif isinstance(df, pd.DataFrame):
+        return _pandas_to_lazyframe
+    elif isinstance(df, pa.Table):
+        return _arrow_to_lazyframe
+    elif hasattr(df, "__dataframe__"):
+        return _interchange_to_lazyframe
+    else:
+        raise_not_supported_external_type(type_="dataframe")
+
+
+# Converters to polars.LazyFrame keyed by input type. Other supported types are
+# added the first time they are converted, so pandas and pyarrow aren't imported
+# until needed
+_LAZYFRAME_CONVERTERS: dict[type, Callable[[Any], pl.LazyFrame]] = {
+    pl.LazyFrame: pl.LazyFrame.lazy,
+    pl.DataFrame: pl.DataFrame.lazy,
+}
+
+
+def _get_lazyframe_converter(df: Any) -> Callable[[Any], pl.LazyFrame]:
+    """Get the function that converts a dataframe to a ``polars.LazyFrame``.
+
+    Parameters
+    ----------
+    df : pl.LazyFrame | pl.DataFrame | pd.DataFrame | pa.Table
+        The input dataframe.
+
+    Returns
+    -------
+    Callable[[Any], pl.LazyFrame]
+        Function converting dataframes of the same type as `df`.
+
+    Raises
+    ------
+    TypeError
+        If `df` is not a supported dataframe type.
+    """
+    type_ = type(df)
+    converter = _LAZYFRAME_CONVERTERS.get(type_)
+    if converter is None:
+        converter = _find_lazyframe_converter(df)
+        _LAZYFRAME_CONVERTERS[type_] = converter
+    return converter
+
+
+# Types accepted for Metadata parameters that are a string or sequence of strings
+_TYPES_TUPLE: tuple[type, ...] = (str, list, tuple)
+# isinstance(x, str) as a builtin callable, so all(map(...)) avoids a generator
+_is_str: Callable[[Any], bool] = str.__instancecheck__
+
+
+@functools.lru_cache(maxsize=256)
+def _get_excluded_fields(
+    cross_section_dim: tuple[str, ...], time_dim: tuple[str, ...]
+) -> frozenset[str]:
+    """Get the fields that aren't data fields of ``Metadata``.
+
+    The result is cached, so ``Metadata`` instances with the same dimensions
+    share the same set.
+
+    Parameters
+    ----------
+    cross_section_dim : tuple[str, ...]
+        The names of the cross-section dimension(s).
+    time_dim : tuple[str, ...]
+        The name of the time dimension.
+
+    Returns
+    -------
+    frozenset[str]
+        The names of the cross-section and time dimensions.
+    """
+    return frozenset(cross_section_dim + time_dim)
+
+
+def _raise_invalid_field_names(field_names: Any) -> None:
+    """Raise an error for invalid `field_names` passed to ``Metadata``.
+
+    Parameters
+    ----------
+    field_names : Any
+        The invalid field names.
+
+    Raises
+    ------
+    ValueError
+        Always raised, with a message describing the expected input.
+    """
+    msg = "`field_names` should be sequence of strings, a string or None."
+    msg += f" But found {field_names}."
+    raise ValueError(msg)
+
+
+@attrs.define(kw_only=True, slots=True, frozen=True, repr=True, weakref_slot=False)
 class Metadata:  # numpydoc ignore=PR02
     """Define metadata for `predictably` data types.
 
@@ -82,6 +223,16 @@ class Metadata:  # numpydoc ignore=PR02
         The name of the data's time-dimension.
     data_fields_ : list[str]
         The name of the data's fields that aren't cross-sectional or time dimensions.
+
+    Notes
+    -----
+    Metadata is immutable. Equality and hashing are based on the parameters, so
+    instances are hashable when their parameter values are hashable (e.g., tuples
+    of field names and no `additional_metadata`).
+
+    The parameters are validated unless Python runs with optimizations enabled
+    (``python -O``). This can be used to skip the validation overhead when the
+    metadata comes from a trusted source.
     """
 
     field_names: Sequence[str] | str | None = attrs.field(default=None)
@@ -90,224 +241,92 @@ class Metadata:  # numpydoc ignore=PR02
     additional_metadata: dict[str, Any] | None = attrs.field(default=None)
     # These are the attrs.fields used to capture post-init attributes that
     # represent cleaned version of user param arguments
-    cross_section_dim_: list[str] = attrs.field(init=False, repr=False, default=None)
-    time_dim_: list[str] = attrs.field(init=False, repr=False, default=None)
-    data_fields_: list[str] = attrs.field(init=False, repr=False, default=None)
+    # They are always set in __attrs_post_init__, so they don't need defaults.
+    # They are derived from the parameters, so they are excluded from eq and hash
+    cross_section_dim_: list[str] = attrs.field(init=False, repr=False, eq=False)
+    time_dim_: list[str] = attrs.field(init=False, repr=False, eq=False)
+    data_fields_: list[str] = attrs.field(init=False, repr=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
-        """One-time post initialization variable augmentation.
-
-        Used to determine the columns that are not cross-section or time-series IDs.
-        """
-        if self.cross_section_dim is None:
-            self.cross_section_dim_ = []
-        elif isinstance(self.cross_section_dim, str):
-            self.cross_section_dim_ = [self.cross_section_dim]
-        else:
-            self.cross_section_dim_ = list(self.cross_section_dim)
-        if self.time_dim is None:
-            self.time_dim_ = []
-        elif isinstance(self.time_dim, str):
-            self.time_dim_ = [self.time_dim]
-
-        if self.field_names is None:
-            self.data_fields_ = []
-        else:
-            field_names_: Sequence[str]
-            if isinstance(self.field_names, str):
-                field_names_ = [self.field_names]
-            else:
-                field_names_ = self.field_names
-            self.data_fields_ = [
-                c
-                for c in field_names_
-                if c not in self.cross_section_dim_ and c not in self.time_dim_
-            ]
-
-    @field_names.validator  # type: ignore
-    def _validate_field_names(
-        self,
-        attribute: attr._make.Attribute,
-        field_names: Sequence[str] | str | None,
-        raise_error: bool = True,
-    ) -> bool:
-        """Validate the `field_names` parameter.
-
-        Provides custom attrs validator implementation that is called during
-        instantiation.
+        """One-time post initialization validation and variable augmentation.
 
-        Parameters
-        ----------
-        attribute : attr._make.Attribute
-            Attrs attribute context.
-        field_names : sequence[str], default=None
-            The field names to validate.
-        raise_error : bool, default=True
-            Whether to raise an error if the type is not valid.
-
-        Returns
-        -------
-        bool
-            Whether the `field_names` parameter is expected type.
+        Validates the parameters and determines the columns that are not
+        cross-section or time-series IDs. Metadata is frozen, so the derived
+        attributes are set using ``object.__setattr__``.
 
         Raises
         ------
         ValueError
-            If the `field_names` input is unexpected type and ``raise_error=True``.
+            If `field_names`, `cross_section_dim`, `time_dim` or
+            `additional_metadata` is an unexpected type.
         """
-        if field_names is None or isinstance(field_names, str):
-            field_names_okay = True
-        else:
-            if not isinstance(field_names, collections.abc.Sequence):
-                field_names_okay = False
-            else:
-                field_names_okay = is_sequence(
-                    field_names, sequence_type=(list, tuple), element_type=str
+        field_names = self.field_names
+        cross_section_dim = self.cross_section_dim
+        time_dim = self.time_dim
+        if __debug__:
+            # Validation is skipped when Python runs with optimizations (-O)
+            if field_names is not None and not isinstance(field_names, _TYPES_TUPLE):
+                _raise_invalid_field_names(field_names)
+
+            if not (
+                cross_section_dim is None
+                or isinstance(cross_section_dim, str)
+                or (
+                    isinstance(cross_section_dim, _TYPES_TUPLE)
+                    and all(map(_is_str, cross_section_dim))
                 )
-        if raise_error and not field_names_okay:
-            msg = "`field_names` should be sequence of strings, a string or None."
-            msg += f" But found {field_names}."
-            raise ValueError(msg)
-        return field_names_okay
-
-    @cross_section_dim.validator  # type: ignore
-    def _validate_cross_section_dim(
-        self,
-        attribute: attr._make.Attribute,
-        cross_section_dim: Sequence[str] | str | None,
-        raise_error: bool = True,
-    ) -> bool:
-        """Validate the `cross_section_dim` parameter.
-
-        Provides custom attrs validator implementation that is called during
-        instantiation.
-
-        Parameters
-        ----------
-        attribute : attr._make.Attribute
-            Attrs attribute context.
-        cross_section_dim : sequence[str], default=None
-            The names of the cross section dimension(s) to validate.
-        raise_error : bool, default=True
-            Whether to raise an error if the type is not valid.
-
-        Returns
-        -------
-        bool
-            Indicates if `cross_section_dim` field passed validation.
-
-        Raises
-        ------
-        ValueError
-            If the `cross_section_dim` input is unexpected type and
-            ``raise_error=True``.
-        """
-        if cross_section_dim is None or isinstance(cross_section_dim, str):
-            cross_section_okay = True
-        else:
-            if not isinstance(cross_section_dim, collections.abc.Sequence):
-                cross_section_okay = False
-            else:
-                cross_section_okay = is_sequence(
-                    cross_section_dim, sequence_type=(list, tuple), element_type=str
-                )
-        if raise_error and not cross_section_okay:
-            msg = "`cross_section_dim` should be sequence of strings, a string or None."
-            msg += f" But found {cross_section_dim}."
-            raise ValueError(msg)
-        return cross_section_okay
-
-    @time_dim.validator  # type: ignore
-    def _validate_time_dim(
-        self,
-        attribute: attr._make.Attribute,
-        time_dim: str | None,
-        raise_error: bool = True,
-    ) -> bool:
-        """Validate the `time_dim` parameter.
-
-        Provides custom attrs validator implementation that is called during
-        instantiation.
-
-        Parameters
-        ----------
-        attribute : attr._make.Attribute
-            Attrs attribute context.
-        time_dim : sequence[str], default=None
-            The name of the time dimension to validate.
-        raise_error : bool, default=True
-            Whether to raise an error if the type is not valid.
-
-        Returns
-        -------
-        bool
-            Indicates if `time_dim` field passed validation.
+            ):
+                msg = "`cross_section_dim` should be sequence of strings, a string "
+                msg += f"or None. But found {cross_section_dim}."
+                raise ValueError(msg)
 
-        Raises
-        ------
-        ValueError
-            If the `time_dim` input is unexpected type and ``raise_error=True``.
-        """
-        if time_dim is None or isinstance(time_dim, str):
-            time_dim_okay = True
-        else:
-            time_dim_okay = False
-            if raise_error:
+            if time_dim is not None and not isinstance(time_dim, str):
                 msg = "`time_dim` should be a string or None. "
                 msg += f"But found {time_dim}."
                 raise ValueError(msg)
-        return time_dim_okay
-
-    @additional_metadata.validator  # type: ignore
-    def _validate_additional_metadata(
-        self,
-        attribute: attr._make.Attribute,
-        additional_metadata: dict[str, Any] | None,
-        raise_error: bool = True,
-    ) -> bool:
-        """Validate the `additional_metadata` parameter.
-
-        Provides custom attrs validator implementation that is called during
-        instantiation.
 
-        Parameters
-        ----------
-        attribute : attr._make.Attribute
-            Attrs attribute context.
-        additional_metadata : sequence[str], default=None
-            The additional metadata to validate.
-        raise_error : bool, default=True
-            Whether to raise an error if the type is not valid.
-
-        Returns
-        -------
-        bool
-            Indicates if `additional_metadata` field passed validation.
+            additional_metadata = self.additional_metadata
+            if additional_metadata is not None and not (
+                isinstance(additional_metadata, dict)
+                and all(map(_is_str, additional_metadata))
+            ):
+                msg = "`additional_metadata` should be a dictionary with string keys."
+                msg += f" But found {additional_metadata}."
+                raise ValueError(msg)
 
-        Raises
-        ------
-        ValueError
-            If the `additional_metadata` input is unexpected type and
-            ``raise_error=True``.
-        """
-        if isinstance(additional_metadata, dict):
-            is_dict = True
-            all_str_keys = all(isinstance(k, str) for k in additional_metadata)
-            additional_metadata_okay = is_dict and all_str_keys
-        elif additional_metadata is None:
-            additional_metadata_okay = True
+        if cross_section_dim is None:
+            cross_section_dim_ = []
+        elif isinstance(cross_section_dim, str):
+            cross_section_dim_ = [cross_section_dim]
         else:
-            additional_metadata_okay = False
-
-        if raise_error and not additional_metadata_okay:
-            msg = "`additional_metadata` should be a dictionary with string keys."
-            msg += f" But found {additional_metadata}."
-            raise ValueError(msg)
+            cross_section_dim_ = list(cross_section_dim)
+        object.__setattr__(self, "cross_section_dim_", cross_section_dim_)
+        time_dim_ = [] if time_dim is None else [time_dim]
+        object.__setattr__(self, "time_dim_", time_dim_)
 
-        return additional_metadata_okay
-
-
-@attrs.define(kw_only=False, slots=False, repr=False)
+        if field_names is None:
+            object.__setattr__(self, "data_fields_", [])
+        else:
+            if isinstance(field_names, str):
+                field_names = [field_names]
+            # Set membership keeps this linear in the number of field names
+            excluded = _get_excluded_fields(tuple(cross_section_dim_), tuple(time_dim_))
+            # Field names are type checked while determining the data fields.
+            # Exact strings are interned, so metadata for many datasets with the
+            # same fields (e.g., each timeseries in a panel) share the same strings.
+            # String subclasses (e.g., numpy.str_) can't be interned
+            intern = sys.intern
+            data_fields = []
+            for c in field_names:
+                if __debug__:
+                    if not isinstance(c, str):
+                        _raise_invalid_field_names(self.field_names)
+                if c not in excluded:
+                    data_fields.append(intern(c) if type(c) is str else c)
+            object.__setattr__(self, "data_fields_", data_fields)
+
+
+@attrs.define(kw_only=False, slots=True, repr=False)
 class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
     """Base class for `predictably` data types.
 
@@ -324,19 +343,91 @@ class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
     Attributes
     ----------
     lazyframe : pl.LazyFrame
-        Representation of the input data as a ``polars.LazyFrame``.
+        Representation of the input data as a ``polars.LazyFrame``. The input
+        data is converted when `lazyframe` is first accessed.
+    schema : Mapping[str, pl.DataType]
+        Mapping of the column names of `lazyframe` to their data types. The
+        schema is resolved when `schema` is first accessed.
     """
 
+    # Functions converting the data's lazyframe to each supported output type.
+    # Child classes can override or extend these to change or add output types
+    _to_dataframe_strategies: ClassVar[
+        dict[str, Callable[[pl.LazyFrame], SupportedDataFrames]]
+    ] = {
+        "polars": lambda lf: lf,
+        "polars_df": pl.LazyFrame.collect,
+        "pandas": lambda lf: lf.collect().to_pandas(),
+    }
+    _to_array_strategies: ClassVar[
+        dict[str, Callable[[pl.LazyFrame], SupportedArrays]]
+    ] = {
+        "numpy": lambda lf: lf.collect().to_numpy(),
+    }
+
     dataframe: SupportedDataFrames
     metadata: Metadata
-    lazyframe: SupportedDataFrames = attrs.field(init=False, repr=False, default=None)
+    _lazyframe: pl.LazyFrame | None = attrs.field(
+        init=False, repr=False, eq=False, alias="_lazyframe", default=None
+    )
+    _schema: Mapping[str, pl.DataType] | None = attrs.field(
+        init=False, repr=False, eq=False, alias="_schema", default=None
+    )
 
     def __attrs_post_init__(self) -> None:
-        """One-time post initialization variable augmentation.
+        """One-time post initialization validation.
+
+        Used to verify the input data can be converted to a lazyframe. The
+        conversion itself is deferred until `lazyframe` is accessed, unless the
+        input data already is a ``polars.LazyFrame``.
+
+        Raises
+        ------
+        TypeError
+            If `dataframe` is not a supported dataframe type.
+        """
+        dataframe = self.dataframe
+        if type(dataframe) is pl.LazyFrame:
+            # Common case that needs no conversion
+            self._lazyframe = dataframe
+        else:
+            _get_lazyframe_converter(dataframe)
+
+    @property
+    def lazyframe(self) -> pl.LazyFrame:
+        """Representation of the input data as a ``polars.LazyFrame``.
 
-        Used to convert input data to a lazyframe.
+        Returns
+        -------
+        pl.LazyFrame
+            The input data converted to a ``polars.LazyFrame`` on first access.
         """
-        self.lazyframe = self._to_lazyframe(self.dataframe)
+        lazyframe = self._lazyframe
+        if lazyframe is None:
+            lazyframe = self._to_lazyframe(self.dataframe)
+            self._lazyframe = lazyframe
+        return lazyframe
+
+    @property
+    def schema(self) -> Mapping[str, pl.DataType]:
+        """Schema of the data's ``polars.LazyFrame`` representation.
+
+        Resolving a lazyframe's schema isn't free, so it is resolved once and
+        reused by later calls.
+
+        Returns
+        -------
+        Mapping[str, pl.DataType]
+            Mapping of column names to their polars data types.
+        """
+        schema = self._schema
+        if schema is None:
+            lazyframe = self.lazyframe
+            # LazyFrame.collect_schema was added in polars 1.0
+            collect_schema = getattr(lazyframe, "collect_schema", None)
+            schema = lazyframe.schema if collect_schema is None else collect_schema()
+            self._schema = schema
+        return schema
 
     @classmethod
     def _generate_metadata(
@@ -468,7 +559,8 @@ class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
         df = cls._array_to_dataframe(array, metadata=metadata)
         return cls(df, metadata)  # type: ignore[call-arg]
 
-    def _to_lazyframe(self, df: SupportedDataFrames) -> pl.LazyFrame:
+    @staticmethod
+    def _to_lazyframe(df: SupportedDataFrames) -> pl.LazyFrame:
         """Convert input dataframe to ``polars.LazyFrame``.
 
         Applies internal logic to convert input data types to ``polars.LazyFrame``.
@@ -483,22 +575,7 @@ class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
         pl.LazyFrame
             A ``polars.LazyFrame`` representing the data in the input dataframe.
         """
-        if isinstance(df, pl.LazyFrame):
-            return df
-        elif isinstance(df, pl.DataFrame):
-            return df.lazy()
-        else:
-            from polars.dependencies import pandas as pd
-            from polars.dependencies import pyarrow as pa
-
-            if isinstance(df, pd.DataFrame):
-                return pl.from_pandas(df, include_index=True).lazy()
-            elif isinstance(df, pa.Table):
-                return pl.from_arrow(df).lazy()
-            elif hasattr(df, "__dataframe__"):
-                return pl.from_dataframe(df, allow_copy=True).lazy()
-            else:
-                raise_not_supported_external_type(type_="dataframe")
+        return _get_lazyframe_converter(df)(df)
 
     @overload
     def to_dataframe(
@@ -536,11 +613,29 @@ class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
         pl.LazyFrame | pl.DataFrame | pd.DataFrame
             Data as requested dataframe type.
 
+        Raises
+        ------
+        ValueError
+            If `output_type` is not a supported dataframe type.
+
         See Also
         --------
         to_array : Output `predictably` data type to a specified array type.
+
+        Notes
+        -----
+        The index of a ``pandas.DataFrame`` input is stored as ordinary columns.
+        When converting to "pandas" the index isn't restored, so those fields are
+        returned as columns with a default ``pandas.RangeIndex``.
         """
-        raise NotImplementedError()
+        strategy = self._to_dataframe_strategies.get(output_type)
+        if strategy is None:
+            options = _format_seq_to_str(
+                tuple(self._to_dataframe_strategies), last_sep="or"
+            )
+            msg = f"`output_type` should be one of {options}. But found {output_type}."
+            raise ValueError(msg)
+        return strategy(self.lazyframe)
 
     @overload
     def to_array(
@@ -572,8 +667,25 @@ class BasePredictablyDataType(BaseObject):  # numpydoc ignore=PR02
         np.ndarray | xa.DataArray
             Data as requested array type.
 
+        Raises
+        ------
+        ValueError
+            If `output_type` is not a supported array type.
+        NotImplementedError
+            If the data type doesn't implement conversion to `output_type`.
+
         See Also
         --------
         to_dataframe : Output `predictably` data type to a specified dataframe type.
         """
-        raise NotImplementedError()
+        strategy = self._to_array_strategies.get(output_type)
+        if strategy is None:
+            if output_type == "xarray":
+                # Labelled arrays depend on the dimensions of each data type
+                raise NotImplementedError()
+            options = _format_seq_to_str(
+                tuple(self._to_array_strategies), last_sep="or"
+            )
+            msg = f"`output_type` should be one of {options}. But found {output_type}."
+            raise ValueError(msg)
+        return strategy(self.lazyframe)
@@ -18,7 +18,7 @@ __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = []
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.define(kw_only=True, slots=True)
 class CrossSection(BasePredictablyDataType):  # numpydoc ignore=PR02
     """`predictably` cross-sectional data type.
 
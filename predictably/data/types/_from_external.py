@@ -8,22 +8,23 @@ or `from_dataframe` on the applicable `predictably` data type.
 from __future__ import annotations
 
 import sys
-from typing import Union
+from typing import Callable, Literal, Union
 
 if sys.version_info < (3, 10):
     from typing_extensions import TypeAlias
 else:
     from typing import TypeAlias
 
+import polars as pl
+
 from predictably.data.types._base import Metadata
 from predictably.data.types._cross_section import CrossSection
 from predictably.data.types._panel import Panel
 from predictably.data.types._timeseries import Timeseries
 from predictably.data.types._types import (
     SupportedDataTypes,
+    check_supported_external_type,
     raise_not_supported_external_type,
-    supported_arrays,
-    supported_dfs,
 )
 
 PredictablyDataType: TypeAlias = Union[CrossSection, Timeseries, Panel]
@@ -31,6 +32,68 @@ PredictablyDataType: TypeAlias = Union[CrossSection, Timeseries, Panel]
 __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = ["from_external_data"]
 
+# Whether an input type is an array or dataframe, keyed by type. The polars types
+# are known upfront. Other types are added the first time they are seen
+_INPUT_TYPES: dict[type, Literal["array", "dataframe"]] = {
+    pl.LazyFrame: "dataframe",
+    pl.DataFrame: "dataframe",
+}
+
+# Constructor for each (has_time_dim, has_cross_section_dim, input type). Data
+# without a time dimension is treated as a cross-section even if there is no
+# explicit cross-section dimension
+_CONSTRUCTORS: dict[
+    tuple[bool, bool, Literal["array", "dataframe"]],
+    Callable[..., PredictablyDataType],
+] = {
+    (True, True, "dataframe"): Panel.from_dataframe,
+    (True, True, "array"): Panel.from_array,
+    (True, False, "dataframe"): Timeseries.from_dataframe,
+    (True, False, "array"): Timeseries.from_array,
+    (False, True, "dataframe"): CrossSection.from_dataframe,
+    (False, True, "array"): CrossSection.from_array,
+    (False, False, "dataframe"): CrossSection.from_dataframe,
+    (False, False, "array"): CrossSection.from_array,
+}
+
+
+def _get_input_type(data: SupportedDataTypes) -> Literal["array", "dataframe"]:
+    """Determine whether input data is a supported array or dataframe.
+
+    The input is first validated against the supported external data types.
+    Supported data is then duck-typed using the dataframe interchange protocol
+    (``__dataframe__``) and the array protocols (``__array__`` or
+    ``__array_interface__``). Dataframes often support the array protocol too, so
+    they're checked first. The result is cached by type.
+
+    Parameters
+    ----------
+    data : pl.LazyFrame | pl.DataFrame | pd.DataFrame | np.ndarray | xa.DataArray
+        The input data.
+
+    Returns
+    -------
+    {"array", "dataframe"}
+        Whether `data` is a supported array or dataframe type.
+
+    Raises
+    ------
+    TypeError
+        If `data` is not one of the external data types supported by `predictably`.
+    """
+    type_ = type(data)
+    input_type = _INPUT_TYPES.get(type_)
+    if input_type is None:
+        check_supported_external_type(data, type_="any")
+        if hasattr(data, "__dataframe__"):
+            input_type = "dataframe"
+        elif hasattr(data, "__array__") or hasattr(data, "__array_interface__"):
+            input_type = "array"
+        else:
+            raise_not_supported_external_type(type_="any")
+        _INPUT_TYPES[type_] = input_type
+    return input_type
+
 
 def from_external_data(
     data: SupportedDataTypes, metadata: Metadata | None = None
@@ -73,12 +136,7 @@ def from_external_data(
     Panel.from_dataframe : Create a :class:`Panel` from a dataframe.
     Panel.from_array : Create a :class:`Panel` from an array.
     """
-    if isinstance(data, supported_arrays):
-        input_type_ = "array"
-    elif isinstance(data, supported_dfs):
-        input_type_ = "dataframe"
-    else:
-        raise_not_supported_external_type()
+    input_type_ = _get_input_type(data)
 
     # Discover metadata
     if metadata is None:
@@ -88,28 +146,5 @@ def from_external_data(
     has_cross_section_dim = len(metadata_.cross_section_dim_) > 0
     has_time_dim = len(metadata_.time_dim_) > 0
 
-    out_data: PredictablyDataType
-    if has_time_dim:
-        # Panel data with cross-sectional and time dimensions
-        if has_cross_section_dim:
-            if input_type_ == "dataframe":
-                out_data = Panel.from_dataframe(data, metadata=metadata_)
-            else:
-                out_data = Panel.from_array(data, metadata=metadata_)
-        # Otherwise we have a standard timeseries
-        else:
-            if input_type_ == "dataframe":
-                out_data = Timeseries.from_dataframe(data, metadata=metadata_)
-            else:
-                out_data = Timeseries.from_array(data, metadata=metadata_)
-    else:
-        # Even if we don't have an explicit cross-section dimension, we'll
-        # treat the dataset as a cross-section if there is no time dimension
-        # At this point we would have raised an error for unsupported data input
-        # so we are dealing with a supported dataframe or array
-        if input_type_ == "dataframe":
-            out_data = CrossSection.from_dataframe(data, metadata=metadata_)
-        else:
-            out_data = CrossSection.from_array(data, metadata=metadata_)
-
-    return out_data
+    constructor = _CONSTRUCTORS[(has_time_dim, has_cross_section_dim, input_type_)]
+    return constructor(data, metadata=metadata_)
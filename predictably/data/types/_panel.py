@@ -18,7 +18,7 @@ __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = ["Panel"]
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.define(kw_only=True, slots=True)
 class Panel(BasePredictablyDataType):  # numpydoc ignore=PR02
     """`predictably` panel data type.
 
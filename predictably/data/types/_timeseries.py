@@ -29,7 +29,7 @@ __author__: list[str] = ["RNKuhns"]
 __all__: list[str] = []
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.define(kw_only=True, slots=True)
 class Timeseries(BasePredictablyDataType):  # numpydoc ignore=PR02
     """`predictably` timeseries data type.
 
@@ -6,10 +6,13 @@ Should be used for typing throughout `predictably`.
 """
 from __future__ import annotations
 
+import functools
 import sys
 import warnings
 from importlib import import_module
 from importlib.util import find_spec
+from operator import attrgetter
+from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -37,6 +40,15 @@ import polars as pl
 from predictably._core._exceptions import ForwardRefError
 from predictably.utils._iter import _format_seq_to_str, _remove_type_text
 
+__author__: list[str] = ["RNKuhns"]
+__all__: list[str] = [
+    "SupportedArrays",
+    "SupportedDataFrames",
+    "SupportedDataTypes",
+    "check_supported_external_type",
+    "raise_not_supported_external_type",
+]
+
 SupportedDataFrames: TypeAlias = Union[
     pl.DataFrame, pl.LazyFrame, "pd.DataFrame", "pa.Table"
 ]
@@ -57,6 +69,12 @@ _supported_external_types: dict[str, tuple[Any, ...]] = {
     "any": supported_data_types,
 }
 
+# The evaluated supported types and unavailable forward references, keyed by
+# `type_`. Filled in by _resolve_supported_external_types on first use
+_resolved_external_types: dict[str, tuple[tuple[type, ...], tuple[str, ...]]] = {}
+# The same evaluated supported types as a set, for exact type lookups
+_exact_external_types: dict[str, frozenset[type]] = {}
+
 dependency_abbrev_map: dict[str, str] = {
     "np": "numpy",
     "pa": "pyarrow",
@@ -65,6 +83,19 @@ dependency_abbrev_map: dict[str, str] = {
     "xa": "xarray",
 }
 dependency_name_map: dict[str, str] = {v: k for k, v in dependency_abbrev_map.items()}
+# Map a module's name or abbreviation to its name or abbreviation respectively
+_to_module_name: dict[str, str] = {
+    **dependency_abbrev_map,
+    **{name: name for name in dependency_name_map},
+}
+_to_module_abbrev: dict[str, str] = {
+    **dependency_name_map,
+    **{abbrev: abbrev for abbrev in dependency_abbrev_map},
+}
+
+# Getters of the attribute a forward ref refers to in its module, keyed by the
+# forward ref's text
+_forward_ref_attr_getters: dict[str, attrgetter] = {}
 
 
 def _get_forward_ref_module_name(fref: str, return_abbrev: bool = False) -> str:
@@ -85,22 +116,37 @@ def _get_forward_ref_module_name(fref: str, return_abbrev: bool = False) -> str:
     str
         The name or abbreviation of the module for the forward reference.
     """
-    msg = f"Error deriving name of forward ref for unsupported dependency {fref}."
-    if return_abbrev:
-        if fref in dependency_abbrev_map:
-            value_ = fref
-        elif fref in dependency_name_map:
-            value_ = dependency_name_map[fref]
-        else:
-            raise ForwardRefError(msg)
-    else:
-        if fref in dependency_name_map:
-            value_ = fref
-        elif fref in dependency_abbrev_map:
-            value_ = dependency_abbrev_map[fref]
-        else:
-            raise ForwardRefError(msg)
-    return value_
+    table = _to_module_abbrev if return_abbrev else _to_module_name
+    try:
+        return table[fref]
+    except KeyError:
+        raise ForwardRefError(forward_ref=fref) from None
+
+
+@functools.lru_cache(maxsize=None)
+def _import_available_module(mod_name: str) -> ModuleType | None:
+    """Import a module if it is available.
+
+    The result is cached, so each module's availability is only checked once.
+    Already imported modules are returned without searching for them.
+
+    Parameters
+    ----------
+    mod_name : str
+        The name of the module to import.
+
+    Returns
+    -------
+    ModuleType | None
+        The imported module or None if it isn't available for import.
+    """
+    mod_ = sys.modules.get(mod_name)
+    if mod_ is None:
+        mod_spec = find_spec(mod_name)
+        if mod_spec is None or mod_spec.loader is None:
+            return None
+        mod_ = import_module(mod_name)
+    return mod_
 
 
 def _evaluate_available_forward_refs(
@@ -133,17 +179,15 @@ def _evaluate_available_forward_refs(
             forward_ref_text = _remove_type_text(s)
             split_forward_ref_text = forward_ref_text.split(".")
             mod_ref = split_forward_ref_text[0]
-            mod_abbrev = _get_forward_ref_module_name(mod_ref, return_abbrev=True)
             mod_name = _get_forward_ref_module_name(mod_ref)
-            mod_spec = find_spec(mod_name)
-            if not (mod_spec is None or mod_spec.loader is None):
-                forward_ref_text_switch_alias = split_forward_ref_text.copy()
-                if mod_ref == mod_abbrev:
-                    forward_ref_text_switch_alias[0] = mod_name
-                mod_ = import_module(mod_name)
-                supported_types.append(
-                    getattr(mod_, ".".join(split_forward_ref_text[1:]))
-                )
+            mod_ = _import_available_module(mod_name)
+            if mod_ is not None:
+                attr_getter = _forward_ref_attr_getters.get(forward_ref_text)
+                if attr_getter is None:
+                    # attrgetter also resolves nested attributes (e.g., "a.b")
+                    attr_getter = attrgetter(".".join(split_forward_ref_text[1:]))
+                    _forward_ref_attr_getters[forward_ref_text] = attr_getter
+                supported_types.append(attr_getter(mod_))
             else:
                 unavailable_supported_types.append(forward_ref_text)
         else:
@@ -151,6 +195,38 @@ def _evaluate_available_forward_refs(
     return tuple(supported_types), tuple(unavailable_supported_types)
 
 
+def _format_supported_type_msg(type_: Literal["dataframe", "array", "any"]) -> str:
+    """Format the message about the types of data that `predictably` supports.
+
+    Used to build the messages in ``_SUPPORTED_TYPE_MSGS`` when the module is
+    imported.
+
+    Parameters
+    ----------
+    type_ : {"dataframe", "array", "any"}
+        Whether the message should refer to supported "dataframe" or "array" types
+        or either of them ('any').
+
+    Returns
+    -------
+    str
+        Message about supported types.
+    """
+    if type_ == "any":
+        type_str = "dataframes and arrays"
+    else:
+        type_str = f"{type_}s"
+    supported = _supported_external_types[type_]
+    supported_text = _format_seq_to_str(supported, last_sep="or", remove_type_text=True)
+    return f"`predictably` only supports {type_str} of type {supported_text}."
+
+
+# The supported types are fixed, so the messages about them are only built once
+_SUPPORTED_TYPE_MSGS: dict[str, str] = {
+    type_: _format_supported_type_msg(type_) for type_ in _supported_external_types
+}
+
+
 def _supported_type_msg(
     type_: Literal["dataframe", "array", "any"] = "dataframe"
 ) -> str:
@@ -170,17 +246,9 @@ def _supported_type_msg(
     str
         Message about supported types.
     """
-    if type_ in ("array", "dataframe"):
-        type_str = f"{type_}s"
-    # elif type_ == "array":
-    #     type_str = f"{type_}s"
-    elif type_ == "any":
-        type_str = "dataframes and arrays"
-    else:
+    msg = _SUPPORTED_TYPE_MSGS.get(type_)
+    if msg is None:
         raise ValueError("`type_` should be 'dataframe', 'array', or 'any'.")
-    supported = _supported_external_types.get(type_)
-    supported_text = _format_seq_to_str(supported, last_sep="or", remove_type_text=True)
-    msg = f"`predictably` only supports {type_str} of type {supported_text}."
     return msg
 
 
@@ -206,6 +274,55 @@ def raise_not_supported_external_type(
     raise TypeError(_supported_type_msg(type_=type_))
 
 
+def _resolve_supported_external_types(
+    type_: Literal["dataframe", "array", "any"]
+) -> tuple[type, ...]:
+    """Get the supported external types that are available for import.
+
+    The forward references of the supported types are evaluated the first time
+    each `type_` is resolved and the result is reused by later calls. This avoids
+    importing optional dependencies when `predictably` is imported.
+
+    Parameters
+    ----------
+    type_ : {"dataframe", "array", "any"}
+        Indicates the supported external data types to resolve.
+
+    Returns
+    -------
+    tuple[type, ...]
+        The supported external types that are available.
+
+    Raises
+    ------
+    ValueError
+        If `type_` is not "dataframe", "array" or "any".
+    """
+    resolved = _resolved_external_types.get(type_)
+    if resolved is None:
+        supported = _supported_external_types.get(type_)
+        if supported is None:
+            raise ValueError("`type_` should be 'dataframe', 'array', or 'any'.")
+        resolved = _evaluate_available_forward_refs(supported)
+        _resolved_external_types[type_] = resolved
+        _exact_external_types[type_] = frozenset(resolved[0])
+        unavailable_supported_ = resolved[1]
+        # Only warn the first time, since the result is reused afterwards
+        if len(unavailable_supported_) > 0:
+            if len(unavailable_supported_) == 1:
+                dep_text = "dependency"
+            else:
+                dep_text = "dependencies"
+            unavailable_text = _format_seq_to_str(
+                unavailable_supported_, last_sep="and", remove_type_text=True
+            )
+            msg = f"`predictably` optional {dep_text} {unavailable_text} are not"
+            msg += " available for import. To use their functionality they should"
+            msg += " be installed."
+            warnings.warn(msg, stacklevel=3)
+    return resolved[0]
+
+
 @overload
 def check_supported_external_type(
     data: SupportedDataFrames, type_: Literal["dataframe"]
@@ -251,21 +368,10 @@ def check_supported_external_type(
     TypeError
         If `data` is not one of the external types supported by `predictably`.
     """
-    supported = _supported_external_types.get(type_)
-    if supported is None:
-        raise ValueError("`type_` should be 'dataframe', 'array', or 'any'.")
-    supported_, unavailable_supported_ = _evaluate_available_forward_refs(supported)
-    if len(unavailable_supported_) > 0:
-        if len(unavailable_supported_) == 1:
-            dep_text = "dependency"
-        else:
-            dep_text = "dependencies"
-        unavailable_text = _format_seq_to_str(
-            unavailable_supported_, last_sep="and", remove_type_text=True
-        )
-        msg = f"`predictably` optional {dep_text} {unavailable_text} are not available"
-        msg += " for import. To use their functionality they should be installed."
-        warnings.warn(msg, stacklevel=2)
+    # Data that is exactly one of the supported types skips the isinstance check
+    if type(data) in _exact_external_types.get(type_, ()):
+        return data
+    supported_ = _resolve_supported_external_types(type_)
     if not isinstance(data, supported_):
         raise_not_supported_external_type(type_=type_)
     return data
@@ -7,18 +7,21 @@ Tests for all data type functionality are included here.
 import re
 from typing import List
 
+import attrs
+import numpy as np
 import polars as pl
 import pytest
-import xarray as xa
 
 __all__: List[str] = []
 __author__: List[str] = ["RNKuhns"]
 
 from predictably._core._exceptions import ForwardRefError
 from predictably.data.types._base import BasePredictablyDataType, Metadata
+from predictably.data.types._from_external import _get_input_type, from_external_data
 from predictably.data.types._types import (
     _evaluate_available_forward_refs,
     _get_forward_ref_module_name,
+    _resolve_supported_external_types,
     _supported_type_msg,
     check_supported_external_type,
     dependency_abbrev_map,
@@ -33,12 +36,94 @@ from predictably.validate import is_sequence
 
 _metadata_post_init_fields = ["cross_section_dim_", "time_dim_", "data_fields_"]
 _base_predictably_data_type_post_init_fields = ["lazyframe"]
-_base_predictably_data_type_not_implemented_methods = (
-    "_generate_metadata",
-    "_array_to_dataframe",
-    "to_dataframe",
-    "to_array",
-)
+# Calls of methods that aren't implemented by BasePredictablyDataType, keyed by the
+# method's name. Each call takes the data type instance, a dataframe and metadata
+_base_predictably_data_type_not_implemented_methods = {
+    "_generate_metadata": lambda base, df, meta: base._generate_metadata(
+        df, metadata=meta
+    ),
+    "_array_to_dataframe": lambda base, df, meta: base._array_to_dataframe(df, meta),
+    "to_array": lambda base, df, meta: base.to_array("xarray"),
+    "from_dataframe": lambda base, df, meta: base.from_dataframe(df, metadata=meta),
+    "from_array": lambda base, df, meta: base.from_array(df.to_numpy(), metadata=meta),
+}
+_field_names = [f"Field_{idx}" for idx in range(3)]
+# Valid Metadata inputs, covering each type accepted by each parameter
+_metadata_okay_inputs = [
+    (None, None, None, None),
+    ("some Column", None, None, None),
+    (_field_names, None, None, None),
+    (tuple(_field_names), "Field_0", None, None),
+    (_field_names, _field_names[:2], "Field_2", None),
+    (None, ("Field_0",), None, {"Some Metadata": 7}),
+    ("some Column", "some Column", "some Column", {"Some Metadata": 7}),
+    (_field_names, None, "some Column", {}),
+]
+_post_init_field_names = ["Cross_Section_Id", "Timestamp", "Column 1", "Column 2"]
+# Metadata kwargs with the expected time_dim_, cross_section_dim_ and data_fields_.
+# First check cases where cross_section_dim and time_dim are in field_names
+# if provided. Then check things work when field_names don't include them
+_metadata_expected_post_init_values = [
+    # field_names, but no cross_section_dim, time_dim
+    ({"field_names": _post_init_field_names}, [], [], _post_init_field_names),
+    # field_names and cross_section_dim
+    (
+        {
+            "field_names": _post_init_field_names,
+            "cross_section_dim": "Cross_Section_Id",
+        },
+        [],
+        ["Cross_Section_Id"],
+        ["Timestamp", "Column 1", "Column 2"],
+    ),
+    # field_names and time_dim
+    (
+        {"field_names": _post_init_field_names, "time_dim": "Timestamp"},
+        ["Timestamp"],
+        [],
+        ["Cross_Section_Id", "Column 1", "Column 2"],
+    ),
+    # field_names and both cross_section_dim and time_dim
+    (
+        {
+            "field_names": _post_init_field_names,
+            "cross_section_dim": "Cross_Section_Id",
+            "time_dim": "Timestamp",
+        },
+        ["Timestamp"],
+        ["Cross_Section_Id"],
+        ["Column 1", "Column 2"],
+    ),
+    # cross_section_dim is a sequence
+    (
+        {
+            "field_names": _post_init_field_names,
+            "cross_section_dim": ("Cross_Section_Id", "Column 1"),
+            "time_dim": "Timestamp",
+        },
+        ["Timestamp"],
+        ["Cross_Section_Id", "Column 1"],
+        ["Column 2"],
+    ),
+    # field_names don't include cross_section_dim and time_dim
+    (
+        {
+            "field_names": "Column 2",
+            "cross_section_dim": ("Cross_Section_Id",),
+            "time_dim": "Timestamp",
+        },
+        ["Timestamp"],
+        ["Cross_Section_Id"],
+        ["Column 2"],
+    ),
+]
+# The start of the error message for invalid input to each Metadata parameter
+_metadata_invalid_input_msgs = {
+    "field_names": "^`field_names` should be sequence",
+    "cross_section_dim": "^`cross_section_dim` should be sequence",
+    "time_dim": "^`time_dim` should be a string",
+    "additional_metadata": "^`additional_metadata` should be a",
+}
 _supported_msg_tester = {
     "any": supported_data_types,
     "dataframe": supported_dfs,
@@ -46,29 +131,30 @@ _supported_msg_tester = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def metadata_post_init_fields():
     """Test fixture for Metadata post init fields.
 
-    Used since lists are mutable and we don't want side effects across tests.
+    The tests only read the fields, so they are shared across the module.
     """
     return _metadata_post_init_fields
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_data_type_post_init_fields():
     """Test fixture for BasePredictablyDataType post init fields.
 
-    Used since lists are mutable and we don't want side effects across tests.
+    The tests only read the fields, so they are shared across the module.
     """
     return _base_predictably_data_type_post_init_fields
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_dataframe():
     """Test fixture for dataframe to test BasePredictablyDataType.
 
-    Used since dataframes can be updated and we don't want side effects across tests.
+    Tests only read or convert the dataframe, so one dataframe is created and
+    shared across the module.
     """
     return pl.from_dict(
         {
@@ -120,27 +206,31 @@ def test_raise_not_supported_external_type_raies_type_error(supported_types):
 
 
 @pytest.mark.parametrize("return_abbrev", (True, False))
-def test_get_forward_ref_module_name(return_abbrev):
+@pytest.mark.parametrize(
+    "fref, expected_name, expected_abbrev",
+    [(abbrev_, name_, abbrev_) for abbrev_, name_ in dependency_abbrev_map.items()]
+    + [(name_, name_, abbrev_) for name_, abbrev_ in dependency_name_map.items()],
+)
+def test_get_forward_ref_module_name(
+    fref, expected_name, expected_abbrev, return_abbrev
+):
     """Test that the _get_forward_ref_module_name function works as expected.
 
     Verify that the correct name or abbreviation are returned.
     """
     msg = "_get_forward_ref_module_name not mapping between names and aliases."
-    for abbrev_ in dependency_abbrev_map:
-        output_ = _get_forward_ref_module_name(abbrev_, return_abbrev=return_abbrev)
-        if return_abbrev:
-            assert output_ == abbrev_, msg
-        else:
-            assert output_ == dependency_abbrev_map[abbrev_], msg
-    for name_ in dependency_name_map:
-        output_ = _get_forward_ref_module_name(name_, return_abbrev=return_abbrev)
-        if return_abbrev:
-            assert output_ == dependency_name_map[name_], msg
-        else:
-            assert output_ == name_, msg
-
-    # Verify an error is raised when trying to evaluate forward Ref of unavailable
-    # module
+    output_ = _get_forward_ref_module_name(fref, return_abbrev=return_abbrev)
+    expected = expected_abbrev if return_abbrev else expected_name
+    assert output_ == expected, msg
+
+
+@pytest.mark.parametrize("return_abbrev", (True, False))
+def test_get_forward_ref_module_name_raises_unavailable(return_abbrev):
+    """Test _get_forward_ref_module_name raises an error for unknown modules.
+
+    Verify an error is raised when trying to evaluate forward Ref of unavailable
+    module.
+    """
     with pytest.raises(ForwardRefError):
         _get_forward_ref_module_name("zz", return_abbrev=return_abbrev)
 
@@ -173,22 +263,44 @@ def test_check_supported_external_type_works_with_valid_input(test_dataframe):
     Used to make sure the supported external data types pass the validation
     as expected.
     """
+    # xarray is an optional dependency that's only needed by this test
+    xa = pytest.importorskip("xarray")
+    pandas_df = test_dataframe.to_pandas()
+    arrow_table = test_dataframe.to_arrow()
+    numpy_array = test_dataframe.to_numpy()
+    xarray_array = xa.DataArray(numpy_array)
     # See if supported dataframes pass check
     for type_ in ("dataframe", "any"):
         check_supported_external_type(test_dataframe, type_=type_)
-        check_supported_external_type(test_dataframe.to_pandas(), type_=type_)
-        check_supported_external_type(test_dataframe.to_arrow(), type_=type_)
+        check_supported_external_type(pandas_df, type_=type_)
+        check_supported_external_type(arrow_table, type_=type_)
 
     # See if supported arrays pass check
     for type_ in ("array", "any"):
-        check_supported_external_type(test_dataframe.to_numpy(), type_=type_)
-        check_supported_external_type(
-            xa.DataArray(test_dataframe.to_numpy()), type_=type_
-        )
+        check_supported_external_type(numpy_array, type_=type_)
+        check_supported_external_type(xarray_array, type_=type_)
+
+    # Subclasses of supported types don't match exactly, but are still supported
+    class DataFrameSubclass(pl.DataFrame):
+        pass
+
+    subclass_df = DataFrameSubclass(test_dataframe)
+    assert check_supported_external_type(subclass_df, type_="dataframe") is subclass_df
 
     # Verify that typerror is raised for unsupported external data types
     with pytest.raises(TypeError, match="^`predictably` only supports.*"):
-        check_supported_external_type(test_dataframe.to_numpy(), type_="dataframe")
+        check_supported_external_type(numpy_array, type_="dataframe")
+
+
+def test_resolve_supported_external_types_reuses_result():
+    """Verify supported external types are only evaluated once per `type_`."""
+    for type_ in _supported_msg_tester:
+        resolved = _resolve_supported_external_types(type_)
+        assert all(isinstance(t, type) for t in resolved)
+        assert _resolve_supported_external_types(type_) is resolved
+
+    with pytest.raises(ValueError, match="`type_` should be 'dataframe'"):
+        _resolve_supported_external_types("zz")
 
 
 def test_check_supported_external_type_raises_invalid_type(test_dataframe):
@@ -211,7 +323,7 @@ def test_metadata_post_init_executes(metadata_post_init_fields, field_names):
     """
     meta = Metadata(field_names=field_names)
     msg = "Post init attributes are not set correctly"
-    assert all(hasattr(meta, a) for a in metadata_post_init_fields), msg
+    assert not set(metadata_post_init_fields).difference(dir(meta)), msg
 
     unexpected_return_types = [
         a
@@ -221,72 +333,29 @@ def test_metadata_post_init_executes(metadata_post_init_fields, field_names):
     assert len(unexpected_return_types) == 0, msg
 
 
-def test_metadata_post_init_set_param_values_match_expected():
+@pytest.mark.parametrize(
+    "kwargs, expected_time_dim, expected_cross_section_dim, expected_data_fields",
+    _metadata_expected_post_init_values,
+)
+def test_metadata_post_init_set_param_values_match_expected(
+    kwargs, expected_time_dim, expected_cross_section_dim, expected_data_fields
+):
     """Test metadata class post initialization sets expected values on attributes.
 
     This goes a step farther to verify that given a set of input we get the
     expected values set on the attributes set post init (cross_section_dim_,
     time_dim_, data_fields_).
     """
-    # First check cases where cross_section_dim and time_dim are in field_names
-    # if provided
-    # field_names, but no cross_section_dim, time_dim
-    field_names = ["Cross_Section_Id", "Timestamp", "Column 1", "Column 2"]
-    meta = Metadata(field_names=field_names)
-    assert meta.time_dim_ == []
-    assert meta.cross_section_dim_ == []
-    assert meta.data_fields_ == field_names
-    # field_names and cross_section_dim
-    meta = Metadata(field_names=field_names, cross_section_dim="Cross_Section_Id")
-    assert meta.time_dim_ == []
-    assert meta.cross_section_dim_ == ["Cross_Section_Id"]
-    assert meta.data_fields_ == [f for f in field_names if f != "Cross_Section_Id"]
-    # field_names and time_dim
-    meta = Metadata(field_names=field_names, time_dim="Timestamp")
-    assert meta.time_dim_ == ["Timestamp"]
-    assert meta.cross_section_dim_ == []
-    assert meta.data_fields_ == [f for f in field_names if f != "Timestamp"]
-    # field_names and both cross_section_dim and time_dim
-    meta = Metadata(
-        field_names=field_names,
-        cross_section_dim="Cross_Section_Id",
-        time_dim="Timestamp",
-    )
-    assert meta.time_dim_ == ["Timestamp"]
-    assert meta.cross_section_dim_ == ["Cross_Section_Id"]
-    assert meta.data_fields_ == [
-        f for f in field_names if f not in ("Cross_Section_Id", "Timestamp")
-    ]
-    # Verify it works when cross_section_dim is a sequence
-    meta = Metadata(
-        field_names=field_names,
-        cross_section_dim=("Cross_Section_Id", "Column 1"),
-        time_dim="Timestamp",
-    )
-    assert meta.time_dim_ == ["Timestamp"]
-    assert meta.cross_section_dim_ == ["Cross_Section_Id", "Column 1"]
-    assert meta.data_fields_ == [
-        f for f in field_names if f not in ("Cross_Section_Id", "Column 1", "Timestamp")
-    ]
-    # Check things work when field_names don't include cross_section_dim and time_dim
-    meta = Metadata(
-        field_names=field_names[-1],
-        cross_section_dim=("Cross_Section_Id",),
-        time_dim="Timestamp",
-    )
-    assert meta.time_dim_ == ["Timestamp"]
-    assert meta.cross_section_dim_ == ["Cross_Section_Id"]
-    assert meta.data_fields_ == [field_names[-1]]
+    meta = Metadata(**kwargs)
+    assert meta.time_dim_ == expected_time_dim
+    assert meta.cross_section_dim_ == expected_cross_section_dim
+    assert meta.data_fields_ == expected_data_fields
 
 
 @pytest.mark.parametrize(
-    "field_names", (None, "some Column", [f"Field_{idx}" for idx in range(3)])
+    "field_names, cross_section_dim, time_dim, additional_metadata",
+    _metadata_okay_inputs,
 )
-@pytest.mark.parametrize(
-    "cross_section_dim", (None, "some Column", [f"Field_{idx}" for idx in range(3)])
-)
-@pytest.mark.parametrize("time_dim", (None, "some Column"))
-@pytest.mark.parametrize("additional_metadata", (None, {"Some Metadata": 7}))
 def test_metadata_attrs_validation_okay_inputs(
     field_names, cross_section_dim, time_dim, additional_metadata
 ):
@@ -306,22 +375,38 @@ def test_metadata_attrs_validation_okay_inputs(
         pytest.fail(msg)  # pragma: no cover
 
 
-def test_metadata_attrs_validation_raises():
+@pytest.mark.parametrize(
+    "invalid_input",
+    (7, 11.0, range(7), lambda: (e for e in range(7))),
+    ids=("int", "float", "range", "generator"),
+)
+@pytest.mark.parametrize("param", [*_metadata_invalid_input_msgs])
+def test_metadata_attrs_validation_raises(param, invalid_input):
     """Test that attrs validation raises error for invalid input.
 
-    Used to make sure invalid input correctly gets flagged as invalid.
+    Used to make sure invalid input correctly gets flagged as invalid for
+    `field_names`, `cross_section_dim`, `time_dim`, and `additional_metadata`.
+    """
+    # Generators are created for each test, since they can only be consumed once
+    if callable(invalid_input):
+        invalid_input = invalid_input()
+    with pytest.raises(ValueError, match=_metadata_invalid_input_msgs[param]):
+        Metadata(**{param: invalid_input})
+
+
+def test_metadata_attrs_validation_raises_invalid_elements():
+    """Test that attrs validation raises error for invalid sequences and dicts.
+
+    Used to make sure sequences and dicts with invalid elements or keys are
+    flagged as invalid.
     """
-    # Check different types of invalid input raise errors for
-    # `field_names`, `cross_section_dim`, `time_dim`, and `additional_metadata`
-    for invalid_input in (7, 11.0, range(7), (e for e in range(7))):
+    # Check sequences with non-string elements raise for `field_names` and
+    # `cross_section_dim`
+    for invalid_input in ([1, 2], ("Some String", 7)):
         with pytest.raises(ValueError, match="^`field_names` should be sequence"):
             Metadata(field_names=invalid_input)
         with pytest.raises(ValueError, match="^`cross_section_dim` should be sequence"):
             Metadata(cross_section_dim=invalid_input)
-        with pytest.raises(ValueError, match="^`time_dim` should be a string"):
-            Metadata(time_dim=invalid_input)
-        with pytest.raises(ValueError, match="^`additional_metadata` should be a"):
-            Metadata(additional_metadata=invalid_input)
 
     # Check sequence of strings raises for `time_dim`
     str_seq = ["Some String", "Another String"]
@@ -335,6 +420,36 @@ def test_metadata_attrs_validation_raises():
         Metadata(additional_metadata={1: "something", 2: 3, 3: 55.0})
 
 
+def test_metadata_does_not_alias_cross_section_dim():
+    """Test that Metadata's derived attributes don't share the caller's list."""
+    cross_section_dim = ["Column 1"]
+    meta = Metadata(cross_section_dim=cross_section_dim)
+    assert meta.cross_section_dim_ is not cross_section_dim
+    cross_section_dim.append("Column 2")
+    assert meta.cross_section_dim_ == ["Column 1"]
+
+
+def test_metadata_frozen_and_hashable():
+    """Test that Metadata is immutable and hashable when its parameters are."""
+    meta = Metadata(field_names=("Timestamp", "Column 1"), time_dim="Timestamp")
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        meta.time_dim = "Column 1"
+
+    same_meta = Metadata(field_names=("Timestamp", "Column 1"), time_dim="Timestamp")
+    assert meta == same_meta
+    assert hash(meta) == hash(same_meta)
+    assert len({meta, same_meta}) == 1
+    assert meta != Metadata(field_names=("Timestamp", "Column 1"))
+
+    # Data field names are interned, so they are shared across instances
+    field_name = "".join(["Column", " 1"])
+    other_meta = Metadata(field_names=("Timestamp", field_name), time_dim="Timestamp")
+    assert other_meta.data_fields_[0] is meta.data_fields_[0]
+    # String subclasses can't be interned, but are still valid field names
+    meta = Metadata(field_names=[np.str_("a"), np.str_("b")])
+    assert meta.data_fields_ == ["a", "b"]
+
+
 def test_base_data_type_post_init_executes(
     base_data_type_post_init_fields, test_dataframe
 ):
@@ -348,31 +463,60 @@ def test_base_data_type_post_init_executes(
     base = BasePredictablyDataType(dataframe=test_dataframe, metadata=meta)
     # Verify that all attributes set in post init exist
     msg = "Post init attributes are not set correctly"
-    assert all(hasattr(base, a) for a in base_data_type_post_init_fields), msg
+    assert not set(base_data_type_post_init_fields).difference(dir(base)), msg
     assert isinstance(base.lazyframe, pl.LazyFrame), msg
 
     # Verify with polars LazyFrame
     base = BasePredictablyDataType(dataframe=test_dataframe.lazy(), metadata=meta)
     # Verify that all attributes set in post init exist
     msg = "Post init attributes are not set correctly"
-    assert all(hasattr(base, a) for a in base_data_type_post_init_fields), msg
+    assert not set(base_data_type_post_init_fields).difference(dir(base)), msg
     assert isinstance(base.lazyframe, pl.LazyFrame), msg
 
     # Verify with pandas dataframe
     base = BasePredictablyDataType(dataframe=test_dataframe.to_pandas(), metadata=meta)
     # Verify that all attributes set in post init exist
     msg = "Post init attributes are not set correctly"
-    assert all(hasattr(base, a) for a in base_data_type_post_init_fields), msg
+    assert not set(base_data_type_post_init_fields).difference(dir(base)), msg
     assert isinstance(base.lazyframe, pl.LazyFrame), msg
 
     # Verify with pyarrow table (has __dataframe__)
     base = BasePredictablyDataType(dataframe=test_dataframe.to_arrow(), metadata=meta)
     # Verify that all attributes set in post init exist
     msg = "Post init attributes are not set correctly"
-    assert all(hasattr(base, a) for a in base_data_type_post_init_fields), msg
+    assert not set(base_data_type_post_init_fields).difference(dir(base)), msg
     assert isinstance(base.lazyframe, pl.LazyFrame), msg
 
 
+def test_base_data_type_lazyframe_converted_on_first_access(test_dataframe):
+    """Test the input dataframe is converted to a lazyframe on first access."""
+    meta = Metadata(field_names=test_dataframe.columns)
+    base = BasePredictablyDataType(dataframe=test_dataframe.to_pandas(), metadata=meta)
+    assert base._lazyframe is None
+    lazyframe = base.lazyframe
+    assert isinstance(lazyframe, pl.LazyFrame)
+    # The converted lazyframe is reused on later access
+    assert base.lazyframe is lazyframe
+
+    # Input that already is a lazyframe is used as is
+    lazy_input = test_dataframe.lazy()
+    base = BasePredictablyDataType(dataframe=lazy_input, metadata=meta)
+    assert base._lazyframe is lazy_input and base.lazyframe is lazy_input
+
+    # Unsupported input is still rejected when the instance is constructed
+    with pytest.raises(TypeError, match="^`predictably` only"):
+        BasePredictablyDataType(dataframe=test_dataframe.to_numpy(), metadata=meta)
+
+
+def test_base_data_type_schema(test_dataframe):
+    """Test the schema of the data is resolved once and matches the input."""
+    meta = Metadata(field_names=test_dataframe.columns)
+    base = BasePredictablyDataType(dataframe=test_dataframe, metadata=meta)
+    schema = base.schema
+    assert dict(schema) == dict(test_dataframe.schema)
+    assert base.schema is schema
+
+
 def test_base_data_type_to_lazyframe_raises_for_unsupported_type(test_dataframe):
     """Verify _to_lazyframe raises an error for unsupported dataframe type.
 
@@ -388,23 +532,87 @@ def test_base_data_type_to_lazyframe_raises_for_unsupported_type(test_dataframe)
         base._to_lazyframe(test_dataframe.to_numpy())
 
 
-def test_base_data_type_not_implemented_methods_raise(test_dataframe):
+def test_base_data_type_from_dataframe_raises_for_unsupported_type(test_dataframe):
+    """Verify from_dataframe raises an error for unsupported dataframe types."""
+    meta = Metadata(field_names=test_dataframe.columns)
+    with pytest.raises(TypeError, match="^`predictably` only supports dataframes"):
+        BasePredictablyDataType.from_dataframe(test_dataframe.to_numpy(), meta)
+
+    # Objects supporting the interchange protocol aren't supported dataframes
+    class InterchangeOnly:
+        def __dataframe__(self, *args, **kwargs):
+            return test_dataframe.__dataframe__(*args, **kwargs)
+
+    with pytest.raises(TypeError, match="^`predictably` only supports dataframes"):
+        BasePredictablyDataType.from_dataframe(InterchangeOnly(), meta)
+
+
+@pytest.mark.parametrize(
+    "method", [*_base_predictably_data_type_not_implemented_methods]
+)
+def test_base_data_type_not_implemented_methods_raise(test_dataframe, method):
     """Verify that methods that aren't implemented on the base class raise an error.
 
     Verifies they are part of the interface, but raise not implemented error.
     """
     meta = Metadata(field_names=test_dataframe.columns)
     base = BasePredictablyDataType(dataframe=test_dataframe, metadata=meta)
+    call = _base_predictably_data_type_not_implemented_methods[method]
     with pytest.raises(NotImplementedError):
-        base._generate_metadata(test_dataframe, metadata=meta)
+        call(base, test_dataframe, meta)
 
-    with pytest.raises(NotImplementedError):
-        base._array_to_dataframe(test_dataframe, meta)
-    with pytest.raises(NotImplementedError):
-        base.to_dataframe()
-    with pytest.raises(NotImplementedError):
-        base.to_array()
-    with pytest.raises(NotImplementedError):
-        base.from_dataframe(test_dataframe, metadata=meta)
-    with pytest.raises(NotImplementedError):
-        base.from_array(test_dataframe.to_numpy(), metadata=meta)
+
+def test_base_data_type_to_dataframe_and_to_array(test_dataframe):
+    """Verify the base class converts its data to the supported output types.
+
+    Also verifies that unsupported output types raise an error.
+    """
+    meta = Metadata(field_names=test_dataframe.columns)
+    base = BasePredictablyDataType(dataframe=test_dataframe, metadata=meta)
+    assert isinstance(base.to_dataframe(), pl.LazyFrame)
+    assert base.to_dataframe("polars_df").equals(test_dataframe)
+    assert base.to_dataframe("pandas").equals(test_dataframe.to_pandas())
+    assert (base.to_array() == test_dataframe.to_numpy()).all()
+
+    # A pandas index is stored as columns and returned as columns
+    pd_df = test_dataframe.to_pandas().set_index(test_dataframe.columns[0])
+    base = BasePredictablyDataType(dataframe=pd_df, metadata=meta)
+    assert base.to_dataframe("pandas").equals(test_dataframe.to_pandas())
+
+    with pytest.raises(ValueError, match="^`output_type` should be one of"):
+        base.to_dataframe("zz")
+    with pytest.raises(ValueError, match=r"^`output_type` should be one of numpy\."):
+        base.to_array("zz")
+
+
+def test_from_external_data_input_type(test_dataframe):
+    """Verify from_external_data identifies arrays and dataframes.
+
+    Supported input types are duck-typed, with dataframes (that often also
+    support the array protocol) identified first.
+    """
+    xa = pytest.importorskip("xarray")
+    assert _get_input_type(test_dataframe) == "dataframe"
+    assert _get_input_type(test_dataframe.lazy()) == "dataframe"
+    assert _get_input_type(test_dataframe.to_pandas()) == "dataframe"
+    assert _get_input_type(test_dataframe.to_numpy()) == "array"
+    assert _get_input_type(xa.DataArray(test_dataframe.to_numpy())) == "array"
+    assert _get_input_type(test_dataframe.to_arrow()) == "dataframe"
+    # Types are cached after the first lookup
+    assert _get_input_type(test_dataframe.to_numpy()) == "array"
+
+
+def test_from_external_data_raises_unsupported_type(test_dataframe):
+    """Verify from_external_data raises an error for unsupported input types.
+
+    Unsupported types are rejected even if they support the array protocol
+    (e.g., ``pandas.Series``).
+    """
+    with pytest.raises(TypeError, match="^`predictably` only"):
+        from_external_data(test_dataframe.to_dicts())
+    series = test_dataframe.to_pandas().iloc[:, 0]
+    msg = "^`predictably` only supports dataframes and arrays"
+    with pytest.raises(TypeError, match=msg):
+        _get_input_type(series)
+    with pytest.raises(TypeError, match=msg):
+        from_external_data(series)
@@ -1,11 +1,10 @@
 """Common functionality for skbase unit tests."""
 
-from copy import deepcopy
 from typing import Any, ClassVar, Dict, List, Optional
 
 import attrs
 
-from predictably._core._base import BaseEstimator, BaseObject
+from predictably._core._base import BaseEstimator, BaseObject, _clone_like
 
 __all__: List[str] = ["Parent", "Child"]
 __author__: List[str] = ["RNKuhns"]
@@ -58,7 +57,7 @@ class CompositionDummy(BaseObject):
 
     def __attrs_post_init__(self):
         """Execute code after init."""
-        self.foo_ = deepcopy(self.foo)
+        self.foo_ = _clone_like(self.foo)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
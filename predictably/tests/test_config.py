@@ -2,6 +2,7 @@
 # The code is copyrighted by the respective scikit-learn developers (BSD-3-Clause
 # License): https://github.com/scikit-learn/scikit-learn/blob/main/COPYING
 """Test configuration functionality."""
+import itertools
 import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
@@ -17,6 +18,27 @@ PRINT_CHANGE_ONLY_VALUES = _CONFIG_REGISTRY["print_changed_only"].get_allowed_va
 DISPLAY_VALUES = _CONFIG_REGISTRY["display"].get_allowed_values()
 DATAFRAME_BACKEND_VALUES = _CONFIG_REGISTRY["dataframe_backend"].get_allowed_values()
 MATH_BACKEND_VALUES = _CONFIG_REGISTRY["math_backend"].get_allowed_values()
+# Grid of all combinations of allowed config values
+CONFIG_VALUE_GRID = tuple(
+    itertools.product(
+        DATAFRAME_BACKEND_VALUES,
+        MATH_BACKEND_VALUES,
+        PRINT_CHANGE_ONLY_VALUES,
+        DISPLAY_VALUES,
+    )
+)
+# Config setting names in the order of the values in CONFIG_VALUE_GRID
+_EXPECTED_TEMPLATE = (
+    "dataframe_backend",
+    "math_backend",
+    "print_changed_only",
+    "display",
+)
+# Test ids that name each setting and its value in the grid
+CONFIG_VALUE_IDS = tuple(
+    "-".join(f"{name}={value}" for name, value in zip(_EXPECTED_TEMPLATE, values))
+    for values in CONFIG_VALUE_GRID
+)
 
 
 @pytest.fixture
@@ -70,6 +92,46 @@ def test_global_config_param_is_valid_param_value(value):
     assert some_config_param.is_valid_param_value(value) == expected_valid
 
 
+def test_global_config_param_is_valid_param_value_unhashable():
+    """Test GlobalConfigParamSetting validation works with unhashable values."""
+    some_config_param = GlobalConfigParamSetting(
+        name="some_param",
+        expected_type=(list, str),
+        default_value="text",
+        allowed_values=(["text"], "diagram"),
+    )
+    assert some_config_param.is_valid_param_value(["text"])
+    assert some_config_param.is_valid_param_value("diagram")
+    assert not some_config_param.is_valid_param_value(["diagram"])
+
+    # Unhashable values are checked against hashable allowed values
+    some_config_param = GlobalConfigParamSetting(
+        name="some_param",
+        expected_type=(list, str),
+        default_value="text",
+        allowed_values=("text", "diagram"),
+    )
+    assert not some_config_param.is_valid_param_value(["text"])
+
+
+def test_global_config_param_update_fields():
+    """Test GlobalConfigParamSetting validation reflects updated fields."""
+    some_config_param = GlobalConfigParamSetting(
+        name="some_param",
+        expected_type=str,
+        default_value="text",
+        allowed_values=("text", "diagram"),
+    )
+    some_config_param.allowed_values = ["text", "table"]
+    assert some_config_param.get_allowed_values() == ("text", "table")
+    assert some_config_param.is_valid_param_value("table")
+    assert not some_config_param.is_valid_param_value("diagram")
+
+    some_config_param.expected_type = int
+    assert some_config_param.get_expected_type() == (int,)
+    assert not some_config_param.is_valid_param_value("text")
+
+
 def test_global_config_get_valid_or_default_warns() -> None:
     """Test GlobalConfigParamSetting.get_valid_param_or_default warns on invalid."""
     some_config_param = GlobalConfigParamSetting(
@@ -96,6 +158,19 @@ def test_global_config_get_valid_or_default_warns() -> None:
     assert returned_value == some_config_param.default_value
 
 
+def test_get_config_value_returns_current_value():
+    """Test get_config_value returns the current value of a setting."""
+    for name, value in pr.get_config().items():
+        assert pr.get_config_value(name) == value
+
+    with pr.config_context(print_changed_only=False):
+        assert pr.get_config_value("print_changed_only") is False
+    assert pr.get_config_value("print_changed_only") is True
+
+    with pytest.raises(KeyError):
+        pr.get_config_value("not_a_setting")
+
+
 def test_get_default_config_always_returns_default(global_config_default):
     """Test get_default_config always returns the default config."""
     assert pr.get_default_config() == global_config_default
@@ -106,10 +181,11 @@ def test_get_default_config_always_returns_default(global_config_default):
     pr.reset_config()
 
 
-@pytest.mark.parametrize("dataframe_backend", DATAFRAME_BACKEND_VALUES)
-@pytest.mark.parametrize("math_backend", MATH_BACKEND_VALUES)
-@pytest.mark.parametrize("print_changed_only", PRINT_CHANGE_ONLY_VALUES)
-@pytest.mark.parametrize("display", DISPLAY_VALUES)
+@pytest.mark.parametrize(
+    "dataframe_backend,math_backend,print_changed_only,display",
+    CONFIG_VALUE_GRID,
+    ids=CONFIG_VALUE_IDS,
+)
 def test_set_config_then_get_config_returns_expected_value(
     dataframe_backend, math_backend, print_changed_only, display
 ):
@@ -121,12 +197,12 @@ def test_set_config_then_get_config_returns_expected_value(
         display=display,
     )
     retrieved_default = pr.get_config()
-    expected_config = {
-        "dataframe_backend": dataframe_backend,
-        "math_backend": math_backend,
-        "print_changed_only": print_changed_only,
-        "display": display,
-    }
+    expected_config = dict(
+        zip(
+            _EXPECTED_TEMPLATE,
+            (dataframe_backend, math_backend, print_changed_only, display),
+        )
+    )
     msg = "`get_config` used after `set_config` does not return expected values.\n"
     msg += "After set_config is run, get_config should return the set values.\n "
     msg += f"Expected {expected_config}, but returned {retrieved_default}."
@@ -194,10 +270,11 @@ def test_config_context_exception():
     pr.reset_config()
 
 
-@pytest.mark.parametrize("dataframe_backend", DATAFRAME_BACKEND_VALUES)
-@pytest.mark.parametrize("math_backend", MATH_BACKEND_VALUES)
-@pytest.mark.parametrize("print_changed_only", PRINT_CHANGE_ONLY_VALUES)
-@pytest.mark.parametrize("display", DISPLAY_VALUES)
+@pytest.mark.parametrize(
+    "dataframe_backend,math_backend,print_changed_only,display",
+    CONFIG_VALUE_GRID,
+    ids=CONFIG_VALUE_IDS,
+)
 def test_reset_config_resets_the_config(
     dataframe_backend, math_backend, print_changed_only, display, global_config_default
 ):
@@ -218,10 +295,11 @@ def test_reset_config_resets_the_config(
     pr.reset_config()
 
 
-@pytest.mark.parametrize("dataframe_backend", DATAFRAME_BACKEND_VALUES)
-@pytest.mark.parametrize("math_backend", MATH_BACKEND_VALUES)
-@pytest.mark.parametrize("print_changed_only", PRINT_CHANGE_ONLY_VALUES)
-@pytest.mark.parametrize("display", DISPLAY_VALUES)
+@pytest.mark.parametrize(
+    "dataframe_backend,math_backend,print_changed_only,display",
+    CONFIG_VALUE_GRID,
+    ids=CONFIG_VALUE_IDS,
+)
 def test_config_context(dataframe_backend, math_backend, print_changed_only, display):
     """Verify that config_context affects context but not overall configuration."""
     # Make sure config is reset to default values then retrieve it
@@ -243,12 +321,12 @@ def test_config_context(dataframe_backend, math_backend, print_changed_only, dis
         display=display,
     ):
         retrieved_context_config = pr.get_config()
-    expected_config = {
-        "dataframe_backend": dataframe_backend,
-        "math_backend": math_backend,
-        "print_changed_only": print_changed_only,
-        "display": display,
-    }
+    expected_config = dict(
+        zip(
+            _EXPECTED_TEMPLATE,
+            (dataframe_backend, math_backend, print_changed_only, display),
+        )
+    )
     msg = "`get_config` does not return expected values within `config_context`.\n"
     msg += "`get_config` should return config defined by `config_context`.\n"
     msg += f"Expected {expected_config}, but returned {retrieved_context_config}."
@@ -337,15 +415,15 @@ def _set_print_changed_only(print_changed_only, sleep_duration):
     """Return the value of print_changed_only after waiting `sleep_duration`."""
     with pr.config_context(print_changed_only=print_changed_only):
         time.sleep(sleep_duration)
-        return pr.get_config()["print_changed_only"]
+        return pr.get_config_value("print_changed_only")
 
 
 def test_config_threadsafe():
     """Test config is actually threadsafe.
 
     Uses threads directly to test that the global config does not change
-    between threads. Same test as `test_config_threadsafe_joblib` but with
-    `ThreadPoolExecutor`.
+    between threads. Same test as `test_config_threadsafe_joblib_threading` but
+    with `ThreadPoolExecutor`.
     """
 
     print_changed_only_vals = [False, True, False, True]
@@ -360,24 +438,42 @@ def test_config_threadsafe():
     pr.reset_config()
 
 
-@pytest.mark.parametrize("backend", ["loky", "multiprocessing", "threading"])
-def test_config_threadsafe_joblib(backend):
-    """Test that the global config is threadsafe with all joblib backends.
-
-    Two jobs are spawned and sets assume_finite to two different values.
-    When the job with a duration 0.1s completes, the assume_finite value
-    should be the same as the value passed to the function. In other words,
-    it is not influenced by the other job setting assume_finite to True.
-    """
+def _run_config_threadsafe_joblib(backend):
+    """Run `_set_print_changed_only` jobs in parallel using a joblib backend."""
     print_changed_only_vals = [False, True, False, True]
-    sleep_durations = [0.1, 0.2, 0.1, 0.2]
+    sleep_durations = [0.01, 0.02, 0.01, 0.02]
 
-    items = Parallel(backend=backend, n_jobs=2)(
+    return Parallel(backend=backend, n_jobs=2)(
         delayed(_set_print_changed_only)(print_changed_only, sleep_dur)
         for print_changed_only, sleep_dur in zip(
             print_changed_only_vals, sleep_durations
         )
     )
 
+
+def test_config_threadsafe_joblib_threading():
+    """Test that the global config is threadsafe with joblib's threading backend.
+
+    Two jobs are spawned and set print_changed_only to two different values.
+    When the shorter job completes, the print_changed_only value should be the
+    same as the value passed to the function. In other words, it is not
+    influenced by the other job setting print_changed_only to another value.
+    """
+    items = _run_config_threadsafe_joblib("threading")
+
+    assert items == [False, True, False, True]
+    pr.reset_config()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("backend", ["loky", "multiprocessing"])
+def test_config_threadsafe_joblib_processes(backend):
+    """Test that the global config is threadsafe with joblib's process backends.
+
+    Same test as `test_config_threadsafe_joblib_threading`, but the jobs run in
+    separate processes, which makes the test slow due to process startup.
+    """
+    items = _run_config_threadsafe_joblib(backend)
+
     assert items == [False, True, False, True]
     pr.reset_config()
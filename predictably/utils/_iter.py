@@ -4,9 +4,9 @@
 # are copyrighted by the skbase developers, BSD-3-Clause License. For
 # conditions see https://github.com/sktime/skbase/blob/main/LICENSE
 """Utility functionality for working with sequences."""  # numpydoc ignore=ES01
-import collections
 import re
-from typing import Any, List, Optional, Sequence, Union
+from collections.abc import Sequence as _SequenceABC
+from typing import Any, FrozenSet, List, Optional, Pattern, Sequence, Union
 
 __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = [
@@ -16,6 +16,11 @@ __all__: List[str] = [
     "_format_seq_to_str",
 ]
 
+# Common scalar types, which can't be sequences
+_SCALAR_TYPES: FrozenSet[type] = frozenset({str, int, float, bool})
+# Pattern matching the text wrapping printed forward references
+_FORWARD_REF_TEXT_RE: Pattern[str] = re.compile(r"^ForwardRef\('(.*)'\)")
+
 
 def _remove_single(x: Sequence[Any]) -> Any:
     """Remove tuple wrapping from singleton.
@@ -41,10 +46,7 @@ def _remove_single(x: Sequence[Any]) -> Any:
     >>> _remove_single([1, 2, 3])
     [1, 2, 3]
     """
-    if len(x) == 1:
-        return x[0]
-    else:
-        return x
+    return x[0] if len(x) == 1 else x
 
 
 def _scalar_to_seq(scalar: Any, sequence_type: Optional[type] = None) -> Sequence[Any]:
@@ -87,15 +89,20 @@ def _scalar_to_seq(scalar: Any, sequence_type: Optional[type] = None) -> Sequenc
     >>> _scalar_to_seq((1, 2))
     (1, 2)
     """
-    # We'll treat str like regular scalar and not a sequence
-    if isinstance(scalar, collections.abc.Sequence) and not isinstance(scalar, str):
+    # We'll treat str like regular scalar and not a sequence. The common concrete
+    # sequence and scalar types are checked before the slower abstract base
+    # class check
+    if isinstance(scalar, (list, tuple)) or (
+        type(scalar) not in _SCALAR_TYPES
+        and not isinstance(scalar, str)
+        and isinstance(scalar, _SequenceABC)
+    ):
         return scalar
-    elif sequence_type is None:
+    elif sequence_type is None or sequence_type is tuple:
         return (scalar,)
-    elif (
-        issubclass(sequence_type, collections.abc.Sequence)
-        and sequence_type != Sequence
-    ):
+    elif sequence_type is list:
+        return [scalar]
+    elif issubclass(sequence_type, _SequenceABC) and sequence_type is not Sequence:
         # Note calling (scalar,) is done to avoid str unpacking
         return sequence_type((scalar,))  # type: ignore
     else:
@@ -134,17 +141,15 @@ def _remove_type_text(input_: Union[str, type]) -> str:
     if not isinstance(input_, str):
         input_ = str(input_)
 
-    m = re.match("^<class '(.*)'>$", input_)
-
-    if m:
-        return m[1]
-
-    else:
-        m_forward_ref = re.match(r"^ForwardRef\('(.*)'\)", input_)
+    # Printed classes are unwrapped with string operations. Only forward
+    # references need the regex
+    if input_.startswith("<class '") and input_.endswith("'>"):
+        return input_[8:-2]
+    elif input_.startswith("ForwardRef('"):
+        m_forward_ref = _FORWARD_REF_TEXT_RE.match(input_)
         if m_forward_ref:
             return m_forward_ref[1]
-        else:
-            return input_
+    return input_
 
 
 def _format_seq_to_str(
@@ -196,6 +201,8 @@ def _format_seq_to_str(
     '1, 2, 3 and 4'
     >>> _format_seq_to_str(seq, last_sep="or")
     '1, 2, 3 or 4'
+    >>> _format_seq_to_str([int], last_sep="or", remove_type_text=True)
+    'int'
     """
     if isinstance(seq, str):
         return seq
@@ -207,22 +214,23 @@ def _format_seq_to_str(
             return _remove_type_text(str(seq))
         else:
             return str(seq)
-    elif not isinstance(seq, collections.abc.Sequence):
+    # isinstance checks the concrete types before the slower abstract base class
+    elif not isinstance(seq, (list, tuple, _SequenceABC)):
         msg = "`seq` must be a sequence or scalar str, int, float, bool or type."
         msg += f"\nBut found {type(seq)}."
         raise TypeError(msg)
 
-    seq_str = [str(e) for e in seq]
+    if len(seq) == 1:
+        # No separators are needed for a single element
+        element_str = str(seq[0])
+        return _remove_type_text(element_str) if remove_type_text else element_str
+
     if remove_type_text:
-        seq_str = [_remove_type_text(s) for s in seq_str]
+        seq_str = [_remove_type_text(str(e)) for e in seq]
+    else:
+        seq_str = [str(e) for e in seq]
 
     if last_sep is None:
-        output_str = sep.join(seq_str)
+        return sep.join(seq_str)
     else:
-        if len(seq_str) == 1:
-            output_str = _remove_single(seq_str)
-        else:
-            output_str = sep.join(e for e in seq_str[:-1])
-            output_str = output_str + f" {last_sep} " + seq_str[-1]
-
-    return output_str
+        return sep.join(seq_str[:-1]) + f" {last_sep} " + seq_str[-1]
@@ -8,13 +8,8 @@
 This module contains functions used throughout `predictably` to provide standard
 validation of inputs to `predictably` methods and functions.
 """
-from typing import List
-
-from predictably.validate._named_objects import (
-    check_sequence_named_objects,
-    is_sequence_named_objects,
-)
-from predictably.validate._types import check_sequence, check_type, is_sequence
+import importlib
+from typing import Any, Dict, List
 
 __author__: List[str] = ["RNKuhns"]
 __all__: List[str] = [
@@ -24,3 +19,45 @@ __all__: List[str] = [
     "is_sequence",
     "is_sequence_named_objects",
 ]
+
+# The validators are imported on first access (PEP 562), so importing this module
+# doesn't import BaseObject's module until the named object validators are used
+_LAZY_IMPORTS: Dict[str, str] = {
+    "check_sequence": "predictably.validate._types",
+    "check_sequence_named_objects": "predictably.validate._named_objects",
+    "check_type": "predictably.validate._types",
+    "is_sequence": "predictably.validate._types",
+    "is_sequence_named_objects": "predictably.validate._named_objects",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily loaded public objects of the module on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the attribute.
+
+    Returns
+    -------
+    Any
+        The requested validation function.
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a public object of the module.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later access doesn't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return the module's attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(__all__))
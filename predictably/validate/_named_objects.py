@@ -162,9 +162,11 @@ def is_sequence_named_objects(
         object_type = BaseObject
 
     is_dict = isinstance(seq_to_check, dict)
-    if (not is_dict and not isinstance(seq_to_check, collections.abc.Sequence)) or (
-        not allow_dict and is_dict
-    ):
+    # Lists and tuples skip the slower abstract base class check
+    is_sequence_ = type(seq_to_check) in (list, tuple) or (
+        not is_dict and isinstance(seq_to_check, collections.abc.Sequence)
+    )
+    if not (is_sequence_ or is_dict) or (not allow_dict and is_dict):
         is_expected_format = False
         return is_expected_format
 
@@ -173,28 +175,29 @@ def is_sequence_named_objects(
     if is_dict:
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(seq_to_check, dict)  # nosec B101
-        elements_expected_format = [
+        all_expected_format = all(
             isinstance(name, str) and isinstance(obj, object_type)
             for name, obj in seq_to_check.items()
-        ]
+        )
         all_unique_names = True
     else:
+        # Stop at the first element that isn't a (str, object_type) tuple, since
+        # the input can't be in the expected format
         names = []
-        elements_expected_format = []
+        all_expected_format = True
         for it in seq_to_check:
             if (
                 isinstance(it, tuple)
                 and len(it) == 2
-                and (isinstance(it[0], str) and isinstance(it[1], object_type))
+                and isinstance(it[0], str)
+                and isinstance(it[1], object_type)
             ):
-                elements_expected_format.append(True)
                 names.append(it[0])
             else:
-                elements_expected_format.append(False)
+                all_expected_format = False
+                break
         all_unique_names = len(set(names)) == len(names)
 
-    all_expected_format = all(elements_expected_format)
-
     if not all_expected_format or (require_unique_names and not all_unique_names):
         is_expected_format = False
     else:
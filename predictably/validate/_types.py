@@ -250,13 +250,18 @@ def is_sequence(
     >>> is_sequence((BaseObject(), BaseEstimator()), element_type=BaseObject)
     True
     """
-    sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
-        sequence_type,
-        input_name="sequence_type",
-        type_input_subclass=collections.abc.Sequence,
-    )
-
-    is_valid_sequence = isinstance(input_seq, sequence_type_)
+    input_type = type(input_seq)
+    if sequence_type is None and (input_type is list or input_type is tuple):
+        # Lists and tuples are always sequences, so the slower check against the
+        # collections.abc.Sequence abstract base class can be skipped
+        is_valid_sequence = True
+    else:
+        sequence_type_ = _convert_scalar_seq_type_input_to_tuple(
+            sequence_type,
+            input_name="sequence_type",
+            type_input_subclass=collections.abc.Sequence,
+        )
+        is_valid_sequence = isinstance(input_seq, sequence_type_)
 
     # Optionally verify elements have correct types
     if element_type is not None: